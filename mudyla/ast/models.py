@@ -168,12 +168,16 @@ class DocumentProperties:
     sequential_execution_default: bool = False
     """Whether sequential execution should be the default"""
 
+    retainers_without_nix: bool = False
+    """Whether retainer actions run directly instead of inside nix develop"""
+
     def merge(self, other: "DocumentProperties") -> "DocumentProperties":
         """Combine properties with another instance."""
         return DocumentProperties(
             sequential_execution_default=(
                 self.sequential_execution_default or other.sequential_execution_default
-            )
+            ),
+            retainers_without_nix=self.retainers_without_nix or other.retainers_without_nix,
         )
 
 
@@ -190,6 +190,7 @@ class CLI:
                 without_nix=args.without_nix,
                 verbose=args.verbose,
                 no_output_on_fail=args.no_out_on_fail,
+                merge_stderr=args.merge_stderr,
                 keep_run_dir=args.keep_run_dir or keep_running,
                 no_color=args.no_color,
                 simple_log=args.simple_log,
@@ -198,6 +199,12 @@ class CLI:
                 use_short_context_ids=use_short_ids,
                 keep_running=keep_running,
                 timeout_ms=args.timeout_ms,
+                reuse_nix_env=args.reuse_nix_env,
+                restore_mode=args.restore_mode,
+                sync_meta=args.sync_meta,
+                max_parallel=args.max_parallel,
+                cache_dir=self._get_cache_dir(args, project_root),
+                cache_max_age_days=args.cache_max_age,
             )
 
             # Print run ID
@@ -449,6 +456,22 @@ class CLI:
         )
         return previous_run_dir
 
+    def _get_cache_dir(self, args: argparse.Namespace, project_root: Path) -> Optional[Path]:
+        """Get the action cache directory, or None when caching is off.
+
+        Args:
+            args: Parsed command-line arguments
+            project_root: Project root path
+
+        Returns:
+            Cache directory if --cache or --cache-dir was given
+        """
+        if args.cache_dir:
+            return Path(args.cache_dir).resolve()
+        if args.cache:
+            return project_root / ".mdl" / "cache"
+        return None
+
     def _print_outputs(
         self,
         outputs_to_report: dict,
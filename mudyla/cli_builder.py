@@ -3,6 +3,17 @@
 import argparse
 
 
+def _positive_int(value: str) -> int:
+    """Parse an integer option that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     """Construct the argparse parser for the CLI."""
     parser = argparse.ArgumentParser(
@@ -56,6 +67,44 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Continue from last run (skip successful actions)",
     )
 
+    parser.add_argument(
+        "--restore-mode",
+        dest="restore_mode",
+        choices=["hardlink", "copy", "symlink"],
+        default="hardlink",
+        help="How --continue brings restored action directories into the new run (default: hardlink)",
+    )
+
+    parser.add_argument(
+        "--sync-meta",
+        dest="sync_meta",
+        action="store_true",
+        help="fsync meta.json and output.json so --continue survives a machine crash",
+    )
+
+    parser.add_argument(
+        "--cache",
+        dest="cache",
+        action="store_true",
+        help="Reuse results of actions whose script and inputs are unchanged since an earlier run",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        type=str,
+        default=None,
+        help="Directory for the action cache (implies --cache, default: .mdl/cache)",
+    )
+
+    parser.add_argument(
+        "--cache-max-age",
+        dest="cache_max_age",
+        type=int,
+        default=30,
+        help="Remove action cache entries unused for this many days, 0 keeps them (default: 30)",
+    )
+
     parser.add_argument(
         "--github-actions",
         dest="github_actions",
@@ -77,6 +126,13 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Force running with Nix (overrides defaults and environment variables)",
     )
 
+    parser.add_argument(
+        "--reuse-nix-env",
+        dest="reuse_nix_env",
+        action="store_true",
+        help="Evaluate the Nix dev shell once per set of kept variables and run actions directly in it",
+    )
+
     parser.add_argument(
         "--verbose",
         dest="verbose",
@@ -91,6 +147,13 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Do not print stdout/stderr for failed actions (except in verbose or GitHub Actions modes)",
     )
 
+    parser.add_argument(
+        "--merge-stderr",
+        dest="merge_stderr",
+        action="store_true",
+        help="Send action stderr straight into stdout.log, leaving stderr.log empty (ignored with --verbose/--github-actions)",
+    )
+
     parser.add_argument(
         "--keep-run-dir",
         dest="keep_run_dir",
@@ -148,6 +211,14 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Force parallel execution (overrides sequential defaults)",
     )
 
+    parser.add_argument(
+        "--max-parallel",
+        type=_positive_int,
+        default=None,
+        dest="max_parallel",
+        help="Maximum number of actions running at once in parallel mode (default: CPU count, at most 32)",
+    )
+
     parser.add_argument(
         "--full-ctx-reprs",
         dest="full_ctx_reprs",
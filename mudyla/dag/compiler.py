@@ -13,7 +13,7 @@ from typing import Dict, List, Set
 
 from ..ast.expansions import ActionExpansion, WeakActionExpansion, RetainedExpansion
 from ..ast.models import ParsedDocument
-from ..cli_args import ParsedCLIInputs, ActionInvocation
+from ..cli_args import ParsedCLIInputs
 from .context import ContextId, ExecutionContext
 from .graph import ActionGraph, ActionNode, ActionKey, Dependency
 
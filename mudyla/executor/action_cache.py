@@ -0,0 +1,140 @@
+"""Content-addressed cache of successful action runs.
+
+Unlike --continue, which restores whatever succeeded in the previous run,
+entries here are keyed by everything an action's result depends on, so a
+hit is valid in any later run with the same inputs.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Temporary entries this old were left behind by runs that died mid-store
+_STALE_TMP_SECONDS = 3600
+
+
+class ActionCache:
+    """Stores completed action directories under a hash of their inputs."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        copy_function: Callable[[str, str], object],
+        max_age_seconds: Optional[float] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one subdirectory per cached action
+            copy_function: File copy function passed to copytree
+            max_age_seconds: Entries unused for longer are removed by prune,
+                or None to keep them forever
+        """
+        self.cache_dir = cache_dir
+        self._copy_function = copy_function
+        self.max_age_seconds = max_age_seconds
+
+    @staticmethod
+    def compute_key(inputs: dict[str, Any]) -> str:
+        """Hash action inputs into a cache key.
+
+        Args:
+            inputs: JSON-serializable description of everything the result depends on
+
+        Returns:
+            Hex digest identifying the inputs
+        """
+        payload = json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Get the cached action directory for a key.
+
+        Args:
+            key: Cache key from compute_key
+
+        Returns:
+            The cached directory, or None on a miss
+        """
+        entry = self.cache_dir / key
+        # meta.json is the last file an entry gets, so its presence marks it complete
+        if not (entry / "meta.json").is_file():
+            return None
+        # The directory's mtime records the last use, which prune goes by
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return entry
+
+    def restore(self, entry: Path, action_dir: Path) -> None:
+        """Copy a cached entry into an action directory.
+
+        Args:
+            entry: Directory returned by lookup
+            action_dir: Destination action directory, which must not exist yet
+        """
+        shutil.copytree(entry, action_dir, copy_function=self._copy_function)
+
+    def store(self, key: str, action_dir: Path) -> None:
+        """Add a completed action directory to the cache.
+
+        The copy is built under a temporary name and renamed into place, so
+        concurrent runs never see a partial entry.
+
+        Args:
+            key: Cache key from compute_key
+            action_dir: Directory of the successful action
+        """
+        entry = self.cache_dir / key
+        if entry.exists():
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_entry = self.cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copytree(action_dir, tmp_entry, copy_function=self._copy_function)
+        try:
+            os.rename(tmp_entry, entry)
+        except OSError:
+            # Another run stored the same key first
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    def prune(self) -> int:
+        """Remove entries unused for longer than max_age_seconds.
+
+        Temporary entries left behind by runs that died mid-store are
+        removed as well. Entries are renamed before being deleted, so
+        concurrent lookups never see a partly removed one.
+
+        Returns:
+            Number of removed entries
+        """
+        try:
+            children = list(os.scandir(self.cache_dir))
+        except FileNotFoundError:
+            return 0
+
+        now = time.time()
+        removed = 0
+        for child in children:
+            is_tmp = child.name.endswith(".tmp")
+            max_age = _STALE_TMP_SECONDS if is_tmp else self.max_age_seconds
+            if max_age is None:
+                continue
+            try:
+                if now - child.stat(follow_symlinks=False).st_mtime <= max_age:
+                    continue
+                path = child.path
+                if not is_tmp:
+                    path = str(self.cache_dir / f".{child.name}.{os.getpid()}.prune.tmp")
+                    os.rename(child.path, path)
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        return removed
@@ -37,6 +37,9 @@ IS_WINDOWS = sys.platform == "win32"
 # Selection indicator - Windows console encoding doesn't support Unicode triangles
 SELECTION_INDICATOR = ">" if IS_WINDOWS else "▶"
 
+# Seconds between redraws; state changes in between are coalesced into one frame
+RENDER_INTERVAL = 0.1
+
 if IS_WINDOWS:
     import msvcrt
 else:
@@ -154,6 +157,8 @@ class ActionLoggerInteractive(ActionLogger):
         self._kill_callback: Optional[Callable[[], None]] = None
         self.live: Optional[Live] = None
         self._main_thread: Optional[threading.Thread] = None
+        # Set by state writers, cleared by the render loop
+        self._dirty = True
 
     # =========================================================================
     # ActionLogger Interface Implementation
@@ -167,6 +172,7 @@ class ActionLoggerInteractive(ActionLogger):
                 self.tasks[action_key].start_time = time.time()
                 if action_dir:
                     self.tasks[action_key].action_dir = action_dir
+                self._dirty = True
 
     def mark_done(self, action_key: ActionKey, duration: float) -> None:
         """Mark a task as done."""
@@ -174,6 +180,7 @@ class ActionLoggerInteractive(ActionLogger):
             if action_key in self.tasks:
                 self.tasks[action_key].status = TaskStatus.DONE
                 self.tasks[action_key].duration = duration
+                self._dirty = True
 
     def mark_failed(self, action_key: ActionKey, duration: float) -> None:
         """Mark a task as failed."""
@@ -181,6 +188,7 @@ class ActionLoggerInteractive(ActionLogger):
             if action_key in self.tasks:
                 self.tasks[action_key].status = TaskStatus.FAILED
                 self.tasks[action_key].duration = duration
+                self._dirty = True
 
     def mark_restored(self, action_key: ActionKey, duration: float, action_dir: Optional[Path] = None) -> None:
         """Mark a task as restored from previous run."""
@@ -190,11 +198,13 @@ class ActionLoggerInteractive(ActionLogger):
                 self.tasks[action_key].duration = duration
                 if action_dir:
                     self.tasks[action_key].action_dir = action_dir
+                self._dirty = True
 
     def mark_execution_complete(self) -> None:
         """Mark execution as complete."""
         with self.lock:
             self.execution_complete = True
+            self._dirty = True
 
     def update_output_sizes(self, action_key: ActionKey, stdout_size: int, stderr_size: int) -> None:
         """Update stdout and stderr sizes for a task."""
@@ -202,6 +212,7 @@ class ActionLoggerInteractive(ActionLogger):
             if action_key in self.tasks:
                 self.tasks[action_key].stdout_size = stdout_size
                 self.tasks[action_key].stderr_size = stderr_size
+                self._dirty = True
 
     def set_kill_callback(self, callback: Callable[[], None]) -> None:
         """Set callback to be called when user requests kill (q key)."""
@@ -1020,10 +1031,31 @@ class ActionLoggerInteractive(ActionLogger):
     # Main Loop
     # =========================================================================
 
+    def _needs_redraw(self) -> bool:
+        """Check whether the next tick has anything new to show.
+
+        Running tasks show a live elapsed time and detail views follow
+        growing log files, so those always redraw.
+        """
+        with self.lock:
+            if self._dirty or self.state != ViewState.TABLE:
+                return True
+            return any(task.status == TaskStatus.RUNNING for task in self.tasks.values())
+
+    def _redraw(self) -> None:
+        """Render the current state in one Live update."""
+        live = self.live
+        if live:
+            self._dirty = False
+            live.update(self._build_renderable(), refresh=True)
+
     def _main_loop(self) -> None:
-        """Main loop handling both input and display updates."""
+        """Main loop handling both input and display updates.
+
+        This is the only thread that renders: state writers just update
+        tasks, and redraws happen at most once per RENDER_INTERVAL.
+        """
         last_update = 0.0
-        update_interval = 1.0 / 24.0
 
         while not self.stop_flag:
             key = self._read_key()
@@ -1034,18 +1066,15 @@ class ActionLoggerInteractive(ActionLogger):
                 else:
                     self._handle_key_scroll(key)
 
-                live = self.live
-                if live:
-                    live.update(self._build_renderable(), refresh=True)
-                last_update = time.time()
+                self._redraw()
+                last_update = time.monotonic()
                 continue
 
-            now = time.time()
-            if now - last_update >= update_interval:
+            now = time.monotonic()
+            if now - last_update >= RENDER_INTERVAL:
                 last_update = now
-                live = self.live
-                if live:
-                    live.update(self._build_renderable(), refresh=True)
+                if self._needs_redraw():
+                    self._redraw()
 
             time.sleep(0.01)
 
@@ -1060,7 +1089,7 @@ class ActionLoggerInteractive(ActionLogger):
         self.live = Live(
             self._build_renderable(),
             console=self.console,
-            refresh_per_second=24,
+            refresh_per_second=round(1 / RENDER_INTERVAL),
             transient=False,
             auto_refresh=False,
             vertical_overflow="visible",
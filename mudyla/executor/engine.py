@@ -2,22 +2,29 @@
 
 import json
 import os
+import queue
 import concurrent.futures
+import hashlib
+import heapq
+import itertools
+import selectors
 import shutil
 import signal
+import stat
 import subprocess
 import time
 import threading
 import sys
 import warnings
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 
 from ..ast.types import ReturnType
 from ..ast.models import ActionDefinition, ActionVersion
-from ..dag.graph import ActionGraph, ActionKey
+from ..dag.graph import ActionGraph, ActionKey, ActionNode
 from ..formatters import OutputFormatter
 from ..formatters.action import truncate_dirname
 from .runtime_registry import RuntimeRegistry
@@ -25,9 +32,146 @@ from .runtime_bash import BashRuntime
 from .runtime_python import PythonRuntime
 from .language_runtime import ExecutionContext, LanguageRuntime
 from .action_logger import ActionLogger
+from .action_cache import ActionCache
+from .meta_writer import MetaWriter
+from .nix_env import NixEnvCache
 
 
-@dataclass
+# Read size for draining child pipes
+_PIPE_CHUNK_SIZE = 65536
+
+# Seconds between output size updates while an action is running
+_SIZE_POLL_INTERVAL = 0.2
+
+# File outputs beyond this count are stat()ed concurrently, by this many threads
+_SERIAL_STAT_LIMIT = 4
+_STAT_WORKERS = 8
+
+# Most bytes of each log printed when an action fails; the full log stays on disk
+_FAILURE_LOG_LIMIT = 256 * 1024
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_script(script_path: Path, content: str) -> None:
+    """Write a generated script, creating it executable in a single open.
+
+    Rendered scripts embed the run directory, so their content never repeats
+    across runs and there is nothing to deduplicate; this only saves the
+    separate chmod and text-layer round trip.
+    """
+    fd = os.open(script_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        _write_all(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard link src to dst, copying instead where links are not possible.
+
+    Used as the copytree copy function when restoring actions: their files
+    are never rewritten, so sharing inodes with the previous run is safe.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device, unsupported filesystem, or link limit reached
+        shutil.copy2(src, dst)
+
+
+def _file_size(path: Path) -> int:
+    """Size of a file in bytes, or 0 if it cannot be read, using a single stat."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _stat_mode(path: Path) -> Optional[int]:
+    """File mode of a path, or None if it does not exist or cannot be read."""
+    try:
+        return path.stat().st_mode
+    except OSError:
+        return None
+
+
+def _pump_pipe(pipe: Any, target_fds: tuple[int, ...]) -> None:
+    """Copy a child pipe to the target descriptors in chunks until EOF."""
+    source_fd = pipe.fileno()
+    while chunk := os.read(source_fd, _PIPE_CHUNK_SIZE):
+        for target_fd in target_fds:
+            _write_all(target_fd, chunk)
+
+
+def _drain_pipes(
+    pipe_targets: dict[Any, tuple[int, ...]], on_tick: Callable[[], None]
+) -> None:
+    """Copy several child pipes to their targets from one thread until all reach EOF.
+
+    Args:
+        pipe_targets: Mapping of child pipe to the descriptors that receive its bytes
+        on_tick: Called roughly every _SIZE_POLL_INTERVAL seconds while draining
+    """
+    with selectors.DefaultSelector() as selector:
+        for pipe, target_fds in pipe_targets.items():
+            selector.register(pipe, selectors.EVENT_READ, target_fds)
+
+        next_tick = time.monotonic() + _SIZE_POLL_INTERVAL
+        while selector.get_map():
+            for key, _ in selector.select(timeout=_SIZE_POLL_INTERVAL):
+                chunk = os.read(key.fd, _PIPE_CHUNK_SIZE)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+                for target_fd in key.data:
+                    _write_all(target_fd, chunk)
+
+            now = time.monotonic()
+            if now >= next_tick:
+                on_tick()
+                next_tick = now + _SIZE_POLL_INTERVAL
+
+
+def _wait_for_exit(process: subprocess.Popen, on_tick: Callable[[], None]) -> int:
+    """Wait for a process to exit, calling on_tick every _SIZE_POLL_INTERVAL seconds.
+
+    Popen.wait(timeout=...) polls waitpid with sleeps of up to 50 ms, which
+    delays noticing that short actions finished. On Linux a pidfd becomes
+    readable exactly when the child exits, so the wait wakes immediately.
+    """
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            # Unsupported kernel, or the child was already reaped by poll()
+            pidfd = None
+
+    if pidfd is not None:
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(pidfd, selectors.EVENT_READ)
+                while not selector.select(timeout=_SIZE_POLL_INTERVAL):
+                    on_tick()
+        finally:
+            os.close(pidfd)
+        return process.wait()
+
+    while True:
+        try:
+            return process.wait(timeout=_SIZE_POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            on_tick()
+
+
+@dataclass(frozen=True, slots=True)
 class ActionResult:
     """Result of executing a single action."""
 
@@ -47,7 +191,7 @@ class ActionResult:
     stderr_size: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SubprocessResult:
     """Result of running a subprocess."""
 
@@ -56,7 +200,7 @@ class SubprocessResult:
     stderr_size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of executing all actions."""
 
@@ -139,7 +283,7 @@ class ExecutionResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PreparedAction:
     """Artifacts required to execute an action."""
 
@@ -154,6 +298,7 @@ class PreparedAction:
     stderr_path: Path
     output_json_path: Path
     exec_cmd: list[str]
+    exec_env: dict[str, str]
 
 
 class ExecutionEngine:
@@ -185,6 +330,13 @@ class ExecutionEngine:
         use_short_context_ids: bool = False,
         keep_running: bool = False,
         timeout_ms: Optional[int] = None,
+        reuse_nix_env: bool = False,
+        restore_mode: str = "hardlink",
+        sync_meta: bool = False,
+        max_parallel: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+        cache_max_age_days: int = 30,
+        merge_stderr: bool = False,
     ):
         self.graph = graph
         self.project_root = project_root
@@ -193,6 +345,22 @@ class ExecutionEngine:
         self.environment_vars = environment_vars
         self.passthrough_env_vars = passthrough_env_vars
         self.previous_run_directory = previous_run_directory
+        self.restore_mode = restore_mode
+        self.max_parallel = max_parallel
+        self.merge_stderr = merge_stderr
+        # Previous-run meta.json contents by action directory name
+        self._prev_meta_cache: dict[str, Optional[dict[str, Any]]] = {}
+        # Action directories of the previous run, listed once so actions that
+        # did not exist there are rejected without touching the filesystem
+        self._prev_action_dirnames: frozenset[str] = frozenset()
+        if previous_run_directory is not None:
+            try:
+                with os.scandir(previous_run_directory) as entries:
+                    self._prev_action_dirnames = frozenset(
+                        entry.name for entry in entries if entry.is_dir()
+                    )
+            except OSError:
+                pass
         self.github_actions = github_actions
         self.without_nix = without_nix
         self.verbose = verbose
@@ -209,16 +377,66 @@ class ExecutionEngine:
         # Create output formatter (includes all sub-formatters)
         self.output = OutputFormatter(no_color=no_color)
 
+        # The environment does not change during a run, so snapshot it once.
+        # Both dicts are shared between actions and must not be mutated.
+        self._base_env = dict(os.environ)
+        self._context_env = self._base_env | self.environment_vars
+
+        # The graph is fixed for the run: count unique dependencies and list the
+        # dependents of every node once, for the parallel scheduler
+        self._dependency_counts: dict[ActionKey, int] = {
+            key: len(node.get_dependency_keys()) for key, node in graph.nodes.items()
+        }
+        self._dependents: dict[ActionKey, tuple[ActionKey, ...]] = {
+            key: tuple({dep.action for dep in node.dependents if dep.action in graph.nodes})
+            for key, node in graph.nodes.items()
+        }
+
+        # meta.json files are written off the scheduling path; they are only
+        # pretty-printed when the run directory is kept for people to read
+        self._meta_writer = MetaWriter(
+            on_error=self.output.print_warning,
+            indent=2 if keep_run_dir else None,
+            sync=sync_meta,
+        )
+
+        # Evaluated nix develop environments, when reusing them across actions
+        self._nix_env_cache: Optional[NixEnvCache] = (
+            NixEnvCache(project_root, self._base_env)
+            if reuse_nix_env and not without_nix
+            else None
+        )
+
+        # Content-addressed cache of successful actions; stores are deferred
+        # until meta.json and output.json have been written
+        self._action_cache = (
+            ActionCache(
+                cache_dir,
+                _link_or_copy,
+                cache_max_age_days * 86400 if cache_max_age_days > 0 else None,
+            )
+            if cache_dir is not None
+            else None
+        )
+        self._pending_cache_stores: list[tuple[str, Path]] = []
+        self._nix_fingerprint = (
+            self._compute_nix_fingerprint() if cache_dir is not None and not without_nix else None
+        )
+
+        # Nix command prefixes keyed by the action's required env vars
+        self._passthrough_env_set = frozenset(passthrough_env_vars)
+        self._nix_prefix_cache: dict[frozenset[str], list[str]] = {}
+
         # Register built-in runtimes once.
         for runtime_cls in (BashRuntime, PythonRuntime):
             RuntimeRegistry.ensure_registered(runtime_cls)
 
         # Generate run directory with nanosecond-grained timestamp
         if run_directory is None:
-            # Use nanosecond timestamp for ordering
-            now = datetime.now()
-            timestamp = now.strftime("%Y%m%d-%H%M%S")
-            nanoseconds = time.time_ns() % 1_000_000_000  # Get nanoseconds within current second
+            # Use nanosecond timestamp for ordering; both parts come from one clock
+            # read so the id cannot straddle a second boundary
+            seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+            timestamp = datetime.fromtimestamp(seconds).strftime("%Y%m%d-%H%M%S")
             run_id = f"{timestamp}-{nanoseconds:09d}"
             self.run_directory = project_root / ".mdl" / "runs" / run_id
         else:
@@ -226,6 +444,18 @@ class ExecutionEngine:
 
         self.run_directory.mkdir(parents=True, exist_ok=True)
 
+        # sys.* values shared by every action; each context adds its own on top
+        self._base_system_vars: dict[str, str | bool] = {
+            "project-root": str(self.project_root),
+            "run-dir": str(self.run_directory),
+            "nix": not self.without_nix,
+        }
+
+        # Action directories include the context only when several contexts run
+        self._use_context_in_dirname = (
+            len({node.key.context_id for node in self.graph.nodes.values()}) > 1
+        )
+
         # Kill signal for graceful termination from interactive table
         self._kill_event = threading.Event()
         self._current_logger: Optional["ActionLogger"] = None
@@ -233,6 +463,7 @@ class ExecutionEngine:
         self._running_processes: set[subprocess.Popen] = set()
         self._processes_lock = threading.Lock()
         self._timeout_timer: Optional[threading.Timer] = None
+        self._cleanup_thread: Optional[threading.Thread] = None
 
     def _start_timeout_timer(self) -> None:
         """Start a background timer that kills all processes on timeout.
@@ -349,13 +580,13 @@ class ExecutionEngine:
         Returns:
             Directory name (with or without context prefix)
         """
-        contexts_in_graph = {node.key.context_id for node in self.graph.nodes.values()}
-        use_context_in_dirname = len(contexts_in_graph) > 1
-
-        if use_context_in_dirname:
+        if self._use_context_in_dirname:
+            # E.g., "platform:jvm+scala:2.12#build" becomes "platform_jvm+scala_2.12#build"
+            # Truncate long names to avoid filesystem limits
             action_key_str = str(action_key)
             return truncate_dirname(action_key_str.replace(":", "_"))
         else:
+            # Single context - use simple action name for backward compatibility
             return action_key.id.name
 
     def _get_action_dir(self, action_key: ActionKey) -> Path:
@@ -478,11 +709,11 @@ class ExecutionEngine:
 
         self.output.print(f"\n{sym.File} [dim]Stdout:[/dim] [blue]{result.stdout_path}[/blue]")
         if result.stdout_path.exists() and not suppress_outputs:
-            self.output.print_raw(result.stdout_path.read_text(encoding="utf-8"))
+            self._print_log_tail(result.stdout_path)
 
         self.output.print(f"\n{sym.File} [dim]Stderr:[/dim] [blue]{result.stderr_path}[/blue]")
         if result.stderr_path.exists() and not suppress_outputs:
-            self.output.print_raw(result.stderr_path.read_text(encoding="utf-8"))
+            self._print_log_tail(result.stderr_path)
 
         if suppress_outputs:
             self.output.print("[dim]Output suppressed; re-run with --verbose or inspect log files for details.[/dim]")
@@ -490,6 +721,23 @@ class ExecutionEngine:
         if result.error_message:
             self.output.print(f"\n{sym.Cross} [bold red]Error:[/bold red] {self.output.escape(result.error_message)}")
 
+    def _print_log_tail(self, log_path: Path) -> None:
+        """Print the end of a log file without loading all of it.
+
+        Args:
+            log_path: Log file to print
+        """
+        with open(log_path, "rb") as log_file:
+            size = os.fstat(log_file.fileno()).st_size
+            if size > _FAILURE_LOG_LIMIT:
+                log_file.seek(size - _FAILURE_LOG_LIMIT)
+                self.output.print(
+                    f"[dim]... {size - _FAILURE_LOG_LIMIT} bytes omitted, "
+                    f"showing the last {_FAILURE_LOG_LIMIT // 1024} KiB ...[/dim]"
+                )
+            data = log_file.read(_FAILURE_LOG_LIMIT)
+        self.output.print_raw(data.decode("utf-8", errors="replace"))
+
     def execute_all(self) -> ExecutionResult:
         """Execute all actions in the graph.
 
@@ -500,7 +748,7 @@ class ExecutionEngine:
             return self._execute_in_parallel()
 
         # Track total execution time
-        graph_start_time = time.time()
+        graph_start_time = time.monotonic()
 
         # Get execution order
         try:
@@ -517,6 +765,7 @@ class ExecutionEngine:
         self._current_logger = logger  # Keep for subprocess access
 
         self._start_timeout_timer()
+        restore_pool, pending_restores = self._start_restores(execution_order)
         try:
             action_outputs: dict[ActionKey, dict[str, Any]] = {}
             action_results: dict[ActionKey, ActionResult] = {}
@@ -534,7 +783,11 @@ class ExecutionEngine:
                 action_dir = self._get_action_dir(action_key)
                 self._notify_action_start(logger, action_key, action_dir)
 
-                result = self._execute_action(action_key, action_outputs)
+                restore_future = pending_restores.pop(action_key, None)
+                if restore_future is not None:
+                    result = restore_future.result()
+                else:
+                    result = self._execute_action(action_key, action_outputs)
                 action_results[action_key] = result
 
                 if result.restored:
@@ -556,6 +809,10 @@ class ExecutionEngine:
 
         finally:
             self._cancel_timeout_timer()
+            if restore_pool is not None:
+                restore_pool.shutdown(wait=True, cancel_futures=True)
+            self._meta_writer.flush()
+            self._store_cached_actions()
             if not self.keep_running:
                 logger.stop()
 
@@ -567,26 +824,55 @@ class ExecutionEngine:
 
         return result
 
+    def _start_restores(
+        self, execution_order: list[ActionKey]
+    ) -> tuple[
+        Optional[concurrent.futures.ThreadPoolExecutor],
+        dict[ActionKey, concurrent.futures.Future[ActionResult]],
+    ]:
+        """Start restoring every restorable action of a sequential run up front.
+
+        Restores only read the previous run and write disjoint directories, so
+        their copies can overlap each other and the actions that do run.
+
+        Args:
+            execution_order: Actions in the order they will be executed
+
+        Returns:
+            The pool doing the restores (None if there is nothing to restore)
+            and the pending restore of each restorable action
+        """
+        restorable = [
+            (action_key, dirname)
+            for action_key in execution_order
+            if self._can_restore_from_previous(dirname := self._get_action_dirname(action_key))
+        ]
+        if not restorable:
+            return None, {}
+
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(16, len(restorable)), thread_name_prefix="mdl-restore"
+        )
+        futures = {
+            action_key: pool.submit(self._restore_from_previous, dirname, action_key)
+            for action_key, dirname in restorable
+        }
+        return pool, futures
+
     def _execute_in_parallel(self) -> ExecutionResult:
         """Execute actions using a dependency-aware thread pool."""
         # Track total execution time
-        graph_start_time = time.time()
+        graph_start_time = time.monotonic()
 
-        # Use ActionKey throughout for type safety
-        pending_deps: dict[ActionKey, set[ActionKey]] = {
-            key: {dep.action for dep in node.dependencies} for key, node in self.graph.nodes.items()
-        }
-        dependents: dict[ActionKey, set[ActionKey]] = {
-            key: {dep.action for dep in node.dependents} for key, node in self.graph.nodes.items()
-        }
-        ready = [key for key, deps in pending_deps.items() if len(deps) == 0]
-        scheduled: set[ActionKey] = set()
-        completed: set[ActionKey] = set()
+        # Each action becomes ready when its count of unfinished dependencies hits zero
+        pending_counts = dict(self._dependency_counts)
         action_outputs: dict[ActionKey, dict[str, Any]] = {}
+        outputs_view = MappingProxyType(action_outputs)
         action_results: dict[ActionKey, ActionResult] = {}
-        lock = threading.Lock()
-        running: dict[concurrent.futures.Future[ActionResult], ActionKey] = {}
-        max_workers = max(1, min(32, os.cpu_count() or 1))
+        # Workers post (key, result) here, so each completion is an O(1) get
+        completion_queue: queue.SimpleQueue[tuple[ActionKey, ActionResult]] = queue.SimpleQueue()
+        running_count = 0
+        max_workers = self._max_workers()
 
         # Create action logger
         execution_order = self.graph.get_execution_order()
@@ -595,22 +881,48 @@ class ExecutionEngine:
 
         restored_actions: list[ActionKey] = []
 
+        # Ready actions wait here rather than in the executor's FIFO, so when
+        # all workers are busy the one heading the longest remaining chain
+        # starts first; the sequence number keeps ties in graph order
+        bottom_levels = self._compute_bottom_levels(execution_order)
+        ready_heap: list[tuple[float, int, ActionKey]] = []
+        sequence = itertools.count()
+
+        def push_ready(action_key: ActionKey) -> None:
+            heapq.heappush(ready_heap, (-bottom_levels[action_key], next(sequence), action_key))
+
+        def run_action(action_key: ActionKey) -> None:
+            # All dependencies of action_key are already recorded and entries are never
+            # removed, so a read-only view is enough; no per-submit copy is needed.
+            try:
+                result = self._execute_action(action_key, outputs_view)
+            except Exception as exc:  # pragma: no cover - defensive
+                result = self._unstarted_failure_result(
+                    str(action_key), f"Execution error: {exc}"
+                )
+            completion_queue.put((action_key, result))
+
         def submit_action(executor: concurrent.futures.ThreadPoolExecutor, action_key: ActionKey) -> None:
-            scheduled.add(action_key)
+            nonlocal running_count
             action_dir = self._get_action_dir(action_key)
             self._notify_action_start(logger, action_key, action_dir)
-            snapshot_outputs = dict(action_outputs)
-            future = executor.submit(self._execute_action, action_key, snapshot_outputs)
-            running[future] = action_key
+            executor.submit(run_action, action_key)
+            running_count += 1
+
+        def submit_ready(executor: concurrent.futures.ThreadPoolExecutor) -> None:
+            while ready_heap and running_count < max_workers:
+                submit_action(executor, heapq.heappop(ready_heap)[2])
 
         self._start_timeout_timer()
         try:
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
                 self._current_executor = executor
-                for key in ready:
-                    submit_action(executor, key)
+                for key, count in pending_counts.items():
+                    if count == 0:
+                        push_ready(key)
+                submit_ready(executor)
 
-                while running:
+                while running_count:
                     if self._kill_event.is_set():
                         executor.shutdown(wait=False, cancel_futures=True)
                         logger.stop()
@@ -620,68 +932,44 @@ class ExecutionEngine:
                             run_directory=self.run_directory,
                         )
 
-                    done, _ = concurrent.futures.wait(
-                        running.keys(),
-                        timeout=0.1,
-                        return_when=concurrent.futures.FIRST_COMPLETED,
-                    )
-
-                    if not done:
+                    try:
+                        action_key, result = completion_queue.get(timeout=0.1)
+                    except queue.Empty:
                         continue
+                    running_count -= 1
+
+                    action_results[action_key] = result
+
+                    if result.restored:
+                        restored_actions.append(action_key)
+
+                    action_dir = self._get_action_dir(action_key)
+                    self._notify_action_result(logger, action_key, action_dir, result)
+
+                    if not result.success:
+                        logger.stop()
+                        self._print_action_failure(result)
+
+                        executor.shutdown(cancel_futures=True)
+                        return ExecutionResult(
+                            success=False,
+                            action_results=action_results,
+                            run_directory=self.run_directory,
+                        )
+
+                    # Only this loop writes; workers read dependency entries, which a
+                    # single dict store publishes atomically, so no lock is needed
+                    action_outputs[action_key] = result.outputs
 
-                    for future in done:
-                        action_key = running.pop(future)
-                        try:
-                            result = future.result()
-                        except Exception as exc:  # pragma: no cover - defensive
-                            result = ActionResult(
-                                action_name=str(action_key),
-                                success=False,
-                                outputs={},
-                                stdout_path=Path("/dev/null"),
-                                stderr_path=Path("/dev/null"),
-                                script_path=Path("/dev/null"),
-                                start_time="",
-                                end_time="",
-                                duration_seconds=0.0,
-                                exit_code=-1,
-                                error_message=f"Execution error: {exc}",
-                            )
-
-                        action_results[action_key] = result
-
-                        if result.restored:
-                            with lock:
-                                restored_actions.append(action_key)
-
-                        action_dir = self._get_action_dir(action_key)
-                        self._notify_action_result(logger, action_key, action_dir, result)
-
-                        if not result.success:
-                            logger.stop()
-                            self._print_action_failure(result)
-
-                            executor.shutdown(cancel_futures=True)
-                            return ExecutionResult(
-                                success=False,
-                                action_results=action_results,
-                                run_directory=self.run_directory,
-                            )
-
-                        with lock:
-                            action_outputs[action_key] = result.outputs
-                            completed.add(action_key)
-
-                        for dependent_key in dependents.get(action_key, set()):
-                            if dependent_key in completed or dependent_key in scheduled:
-                                continue
-                            pending_deps[dependent_key].discard(action_key)
-                            if len(pending_deps[dependent_key]) == 0:
-                                submit_action(executor, dependent_key)
+                    for dependent_key in self._dependents[action_key]:
+                        pending_counts[dependent_key] -= 1
+                        if pending_counts[dependent_key] == 0:
+                            push_ready(dependent_key)
+                    submit_ready(executor)
 
         except KeyboardInterrupt:
-            for future in running:
-                future.cancel()
+            if self._current_executor:
+                self._current_executor.shutdown(wait=False, cancel_futures=True)
             logger.stop()
 
             return ExecutionResult(
@@ -691,6 +979,8 @@ class ExecutionEngine:
             )
         finally:
             self._cancel_timeout_timer()
+            self._meta_writer.flush()
+            self._store_cached_actions()
             self._current_executor = None
             if not self.keep_running:
                 logger.stop()
@@ -703,45 +993,100 @@ class ExecutionEngine:
 
         return result
 
+    def _compute_bottom_levels(self, execution_order: list[ActionKey]) -> dict[ActionKey, float]:
+        """Compute the length of the longest chain of work starting at each action.
+
+        Each action weighs its duration in the previous run when one is
+        available (--continue), and 1 otherwise.
+
+        Args:
+            execution_order: Actions in dependency order
+
+        Returns:
+            Mapping of action to its own weight plus its heaviest dependent chain
+        """
+        bottom_levels: dict[ActionKey, float] = {}
+        for action_key in reversed(execution_order):
+            meta = self._load_prev_meta(self._get_action_dirname(action_key))
+            weight = meta.get("duration_seconds", 1.0) if meta else 1.0
+            bottom_levels[action_key] = weight + max(
+                (bottom_levels[dependent] for dependent in self._dependents[action_key]),
+                default=0.0,
+            )
+        return bottom_levels
+
+    def _max_workers(self) -> int:
+        """Get how many actions may run at once in parallel mode.
+
+        Returns:
+            The --max-parallel value if given, otherwise the CPU count capped at 32
+        """
+        if self.max_parallel is not None:
+            return self.max_parallel
+        return max(1, min(32, os.cpu_count() or 1))
+
     def _execute_action(
-        self, action_key: ActionKey, action_outputs: dict[ActionKey, dict[str, Any]]
+        self, action_key: ActionKey, action_outputs: Mapping[ActionKey, dict[str, Any]]
     ) -> ActionResult:
         """Execute a single action identified by its ActionKey."""
         action_key_str = str(action_key)
 
-        # Determine directory name using same logic as preparation
-        contexts_in_graph = {node.key.context_id for node in self.graph.nodes.values()}
-        use_context_in_dirname = len(contexts_in_graph) > 1
-        if use_context_in_dirname:
-            action_dirname = truncate_dirname(action_key_str.replace(":", "_"))
-        else:
-            action_dirname = action_key.id.name
-
+        action_dirname = self._get_action_dirname(action_key)
         if self._can_restore_from_previous(action_dirname):
-            return self._restore_from_previous(action_dirname, action_key_str)
+            return self._restore_from_previous(action_dirname, action_key)
 
         try:
             prepared = self._prepare_action_execution(action_key, action_outputs)
         except ValueError as err:
-            now_iso = datetime.now().isoformat()
-            return ActionResult(
-                action_name=action_key_str,
-                success=False,
-                outputs={},
-                stdout_path=Path("/dev/null"),
-                stderr_path=Path("/dev/null"),
-                script_path=Path("/dev/null"),
-                start_time=now_iso,
-                end_time=now_iso,
-                duration_seconds=0.0,
-                exit_code=-1,
-                error_message=str(err),
+            return self._unstarted_failure_result(
+                action_key_str, str(err), datetime.now().isoformat()
             )
 
-        return self._run_prepared_action(prepared)
+        if self._action_cache is None:
+            return self._run_prepared_action(prepared)
+
+        cache_key = self._action_cache_key(prepared)
+        cache_entry = self._action_cache.lookup(cache_key)
+        if cache_entry is not None:
+            return self._restore_from_cache(cache_entry, prepared)
+
+        result = self._run_prepared_action(prepared)
+        if result.success:
+            self._pending_cache_stores.append((cache_key, prepared.action_dir))
+        return result
+
+    @staticmethod
+    def _unstarted_failure_result(
+        action_name: str, error_message: str, timestamp: str = ""
+    ) -> ActionResult:
+        """Build the result for an action that failed before its process started.
+
+        Such actions have no logs or script, so their paths point at /dev/null.
+
+        Args:
+            action_name: Full ActionKey string for the result
+            error_message: Why the action failed
+            timestamp: Used as both start and end time
+
+        Returns:
+            Failed action result with exit code -1
+        """
+        return ActionResult(
+            action_name=action_name,
+            success=False,
+            outputs={},
+            stdout_path=Path("/dev/null"),
+            stderr_path=Path("/dev/null"),
+            script_path=Path("/dev/null"),
+            start_time=timestamp,
+            end_time=timestamp,
+            duration_seconds=0.0,
+            exit_code=-1,
+            error_message=error_message,
+        )
 
     def _prepare_action_execution(
-        self, action_key: ActionKey, action_outputs: dict[ActionKey, dict[str, Any]]
+        self, action_key: ActionKey, action_outputs: Mapping[ActionKey, dict[str, Any]]
     ) -> PreparedAction:
         """Prepare an action for execution.
 
@@ -759,23 +1104,12 @@ class ExecutionEngine:
         if version is None:
             raise ValueError("No valid version selected")
 
-        # Determine if we need context in directory name (for multi-context executions)
-        # If there are multiple distinct contexts in the graph, include context to avoid collisions
-        contexts_in_graph = {node.key.context_id for node in self.graph.nodes.values()}
-        use_context_in_dirname = len(contexts_in_graph) > 1
-
-        if use_context_in_dirname:
-            # Include context in directory name for multi-context executions
-            # E.g., "platform:jvm+scala:2.12#build" becomes "platform_jvm+scala_2.12#build"
-            # Truncate long names to avoid filesystem limits
-            action_key_str = str(action_key)
-            safe_dir_name = truncate_dirname(action_key_str.replace(":", "_"))
-        else:
-            # Single context - use simple action name for backward compatibility
-            safe_dir_name = action_key.id.name
-
-        action_dir = self.run_directory / safe_dir_name
-        action_dir.mkdir(parents=True, exist_ok=True)
+        action_dir = self._get_action_dir(action_key)
+        # run_directory is created in __init__, so only the leaf is missing
+        try:
+            os.mkdir(action_dir)
+        except FileExistsError:
+            pass
 
         runtime = RuntimeRegistry.get(version.language)
 
@@ -785,7 +1119,7 @@ class ExecutionEngine:
         action_flags = node.flags if node.flags is not None else self.flags
 
         context = self._build_execution_context(
-            action_dir, action_outputs, action_args, action_flags, action_key
+            action_dir, action_outputs, action_args, action_flags, node
         )
 
         output_json_path = action_dir / "output.json"
@@ -798,14 +1132,14 @@ class ExecutionEngine:
 
         script_ext = ".sh" if version.language == "bash" else ".py"
         script_path = action_dir / f"script{script_ext}"
-        script_path.write_text(rendered.content, encoding="utf-8")
-        script_path.chmod(0o755)
+        _write_script(script_path, rendered.content)
 
         stdout_path = action_dir / "stdout.log"
         stderr_path = action_dir / "stderr.log"
 
         base_exec_cmd = runtime.get_execution_command(script_path)
         exec_cmd = self._build_exec_command(action, base_exec_cmd)
+        exec_env = self._build_exec_env(action)
 
         return PreparedAction(
             action_key=action_key,
@@ -819,15 +1153,16 @@ class ExecutionEngine:
             stderr_path=stderr_path,
             output_json_path=output_json_path,
             exec_cmd=exec_cmd,
+            exec_env=exec_env,
         )
 
     def _build_execution_context(
         self,
         action_dir: Path,
-        action_outputs: dict[ActionKey, dict[str, Any]],
+        action_outputs: Mapping[ActionKey, dict[str, Any]],
         args: dict[str, str],
         flags: dict[str, bool],
-        action_key: ActionKey,
+        node: ActionNode,
     ) -> ExecutionContext:
         """Build execution context with provided args and flags.
 
@@ -836,7 +1171,7 @@ class ExecutionEngine:
             action_outputs: Outputs from previous actions (keyed by ActionKey)
             args: Arguments for this action (may be per-action or global)
             flags: Flags for this action (may be per-action or global)
-            action_key: The ActionKey for this action (to resolve dependencies)
+            node: Graph node of the action (to resolve dependencies)
 
         Returns:
             ExecutionContext for the action
@@ -846,25 +1181,22 @@ class ExecutionEngine:
         # action itself. We use the actual dependency ActionKeys from the graph to
         # resolve the correct outputs.
         dependency_outputs: dict[str, dict[str, Any]] = {}
-        node = self.graph.get_node(action_key)
         for dep in node.dependencies:
             if dep.action in action_outputs:
                 # Use the dependency's action name as the key for ${action.name.var}
                 dependency_outputs[dep.action.id.name] = action_outputs[dep.action]
 
-        axis_values = action_key.context_id.to_dict()
+        axis_values = node.key.context_id.to_dict()
         axis_sys_vars = {f"axis.{name}": value for name, value in axis_values.items()}
 
         return ExecutionContext(
             system_vars={
-                "project-root": str(self.project_root),
-                "run-dir": str(self.run_directory),
+                **self._base_system_vars,
                 "action-dir": str(action_dir),
-                "nix": not self.without_nix,
                 **axis_sys_vars,
             },
             axis_values=axis_values,
-            env_vars=dict(os.environ) | self.environment_vars,
+            env_vars=self._context_env,
             md_env_vars=self.environment_vars,
             args=args,
             flags=flags,
@@ -874,17 +1206,40 @@ class ExecutionEngine:
     def _build_exec_command(
         self, action: ActionDefinition, base_exec_cmd: list[str]
     ) -> list[str]:
-        if self.without_nix:
+        # A reused nix environment is applied through the process env instead
+        if self.without_nix or self._nix_env_cache is not None:
             return base_exec_cmd
 
-        env_vars_to_keep = set(self.passthrough_env_vars)
-        env_vars_to_keep.update(action.required_env_vars.keys())
+        return self._nix_prefix(action) + base_exec_cmd
+
+    def _build_exec_env(self, action: ActionDefinition) -> dict[str, str]:
+        """Get the environment to start an action's process with.
 
-        exec_cmd = ["nix", "develop", "--ignore-environment"]
-        for var in sorted(env_vars_to_keep):
-            exec_cmd.extend(["--keep", var])
-        exec_cmd.extend(["--command"] + base_exec_cmd)
-        return exec_cmd
+        Args:
+            action: Action being executed
+
+        Returns:
+            Shared environment dict; must not be mutated
+        """
+        if self.without_nix or self._nix_env_cache is None:
+            return self._base_env
+
+        return self._nix_env_cache.get(self._nix_prefix(action))
+
+    def _nix_prefix(self, action: ActionDefinition) -> list[str]:
+        """Get the `nix develop ... --command` prefix for an action."""
+        # The nix prefix only depends on the required env vars; the script path
+        # in base_exec_cmd is unique per action, so only the prefix is cached.
+        required_env_vars = frozenset(action.required_env_vars)
+        prefix = self._nix_prefix_cache.get(required_env_vars)
+        if prefix is None:
+            prefix = ["nix", "develop", "--ignore-environment"]
+            for var in sorted(self._passthrough_env_set | required_env_vars):
+                prefix.extend(["--keep", var])
+            prefix.append("--command")
+            self._nix_prefix_cache[required_env_vars] = prefix
+
+        return prefix
 
     def _execute_subprocess(
         self,
@@ -893,6 +1248,13 @@ class ExecutionEngine:
     ) -> SubprocessResult:
         """Execute subprocess and stream output to files.
 
+        In quiet mode the child's stdout is attached directly to stdout.log, so
+        the kernel moves those bytes without passing through Python. Stderr is
+        piped because it is copied into both stderr.log and stdout.log, unless
+        merge_stderr is set, in which case it is attached to stdout.log too and
+        no pipe is pumped at all. When echoing to the console (verbose/GitHub
+        Actions), both pipes are pumped in 64 KiB chunks instead of line by line.
+
         Args:
             prepared: Prepared action with paths and command
             logger: Optional action logger for progress updates
@@ -900,96 +1262,86 @@ class ExecutionEngine:
         Returns:
             SubprocessResult with returncode and output sizes
         """
-        stdout_size = 0
-        stderr_size = 0
+        tee_console = self.github_actions or self.verbose
+        merge_stderr = self.merge_stderr and not tee_console
+
+        # O_APPEND lets the child and the stderr pump share stdout.log safely
+        log_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND
+        stdout_fd = os.open(prepared.stdout_path, log_flags, 0o644)
+        try:
+            stderr_fd = os.open(prepared.stderr_path, log_flags, 0o644)
+        except OSError:
+            os.close(stdout_fd)
+            raise
 
-        with open(prepared.stdout_path, "w", encoding="utf-8") as stdout_file, open(
-            prepared.stderr_path, "w", encoding="utf-8"
-        ) as stderr_file:
+        try:
             # Unix: start_new_session=True creates a new process group, allowing us to
             # kill the entire process tree (including nix develop children) via os.killpg.
             # Windows: Not needed - we use taskkill /T which traverses parent-child tree.
+            # Keep preexec_fn unset: without it CPython starts the child with
+            # vfork rather than copying the engine's address space with fork
             process = subprocess.Popen(
                 prepared.exec_cmd,
                 cwd=str(self.project_root),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=os.environ.copy(),
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
+                stdout=subprocess.PIPE if tee_console else stdout_fd,
+                stderr=stdout_fd if merge_stderr else subprocess.PIPE,
+                env=prepared.exec_env,
                 start_new_session=(sys.platform != "win32"),
             )
 
             with self._processes_lock:
                 self._running_processes.add(process)
 
-            try:
-                size_lock = threading.Lock()
-
-                if self.github_actions or self.verbose:
-                    self._configure_console_stream(sys.stdout)
-                    self._configure_console_stream(sys.stderr)
-
-                def stream_output(
-                    pipe: Any,
-                    console_stream: Any,
-                    file_stream: Any,
-                    combined_file: Any,
-                    is_stdout: bool,
-                ) -> None:
-                    nonlocal stdout_size, stderr_size
-                    if not pipe:
-                        return
-                    for line in pipe:
-                        if self.github_actions or self.verbose:
-                            console_stream.write(line)
-                            console_stream.flush()
-
-                        file_stream.write(line)
-                        file_stream.flush()
-
-                        if not is_stdout and combined_file:
-                            combined_file.write(line)
-                            combined_file.flush()
-
-                        line_bytes = len(line.encode("utf-8"))
-                        with size_lock:
-                            if is_stdout:
-                                stdout_size += line_bytes
-                            else:
-                                stderr_size += line_bytes
-                                stdout_size += line_bytes
-
-                            if logger:
-                                logger.update_output_sizes(
-                                    prepared.action_key, stdout_size, stderr_size
-                                )
-
-                stdout_thread = threading.Thread(
-                    target=stream_output,
-                    args=(process.stdout, sys.stdout, stdout_file, None, True),
-                )
-                stderr_thread = threading.Thread(
-                    target=stream_output,
-                    args=(process.stderr, sys.stderr, stderr_file, stdout_file, False),
-                )
+            reported_sizes = (0, 0)
 
-                stdout_thread.start()
-                stderr_thread.start()
-                returncode = process.wait()
-                stdout_thread.join()
-                stderr_thread.join()
+            def report_sizes() -> None:
+                # Unchanged sizes are not re-sent, so idle actions cost no logger locking
+                nonlocal reported_sizes
+                if not logger:
+                    return
+                sizes = (os.fstat(stdout_fd).st_size, os.fstat(stderr_fd).st_size)
+                if sizes != reported_sizes:
+                    logger.update_output_sizes(prepared.action_key, *sizes)
+                    reported_sizes = sizes
+
+            try:
+                pipe_targets: dict[Any, tuple[int, ...]] = {}
+                if tee_console:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    pipe_targets[process.stdout] = (stdout_fd, sys.stdout.fileno())
+                    pipe_targets[process.stderr] = (stderr_fd, stdout_fd, sys.stderr.fileno())
+                elif not merge_stderr:
+                    pipe_targets[process.stderr] = (stderr_fd, stdout_fd)
+
+                pumps: list[threading.Thread] = []
+                if sys.platform == "win32":
+                    # Windows selectors cannot wait on pipes, so pump each one in a thread
+                    for pipe, target_fds in pipe_targets.items():
+                        pump = threading.Thread(target=_pump_pipe, args=(pipe, target_fds))
+                        pump.start()
+                        pumps.append(pump)
+                elif pipe_targets:
+                    _drain_pipes(pipe_targets, report_sizes)
+
+                # Keep reporting sizes until exit; stdout may outlive a closed stderr
+                returncode = _wait_for_exit(process, report_sizes)
+
+                for pump in pumps:
+                    pump.join()
             finally:
                 with self._processes_lock:
                     self._running_processes.discard(process)
+                for pipe in (process.stdout, process.stderr):
+                    if pipe:
+                        pipe.close()
 
-        # Get final file sizes
-        if prepared.stdout_path.exists():
-            stdout_size = prepared.stdout_path.stat().st_size
-        if prepared.stderr_path.exists():
-            stderr_size = prepared.stderr_path.stat().st_size
+            # Get final file sizes
+            stdout_size = os.fstat(stdout_fd).st_size
+            stderr_size = os.fstat(stderr_fd).st_size
+        finally:
+            os.close(stdout_fd)
+            os.close(stderr_fd)
 
         if logger:
             logger.update_output_sizes(prepared.action_key, stdout_size, stderr_size)
@@ -1000,16 +1352,6 @@ class ExecutionEngine:
             stderr_size=stderr_size,
         )
 
-    @staticmethod
-    def _configure_console_stream(stream: Any) -> None:
-        if not stream:
-            raise RuntimeError("Console stream is required to configure encoding errors.")
-        if not hasattr(stream, "reconfigure"):
-            raise RuntimeError(
-                "Console stream does not support reconfigure; cannot set encoding errors."
-            )
-        stream.reconfigure(errors="replace")
-
     def _create_action_result(
         self,
         prepared: PreparedAction,
@@ -1023,7 +1365,7 @@ class ExecutionEngine:
         stderr_size: int,
         error_message: Optional[str] = None,
     ) -> ActionResult:
-        """Create ActionResult with common parameters from PreparedAction.
+        """Create ActionResult with common parameters from PreparedAction and write its meta.json.
 
         Args:
             prepared: Prepared action with paths
@@ -1040,18 +1382,22 @@ class ExecutionEngine:
         Returns:
             ActionResult with all fields populated
         """
-        self._write_action_meta(
-            prepared.action_dir,
-            prepared.action.name,
-            success=success,
-            start_time=start_time_iso,
-            end_time=end_time_iso,
-            duration=duration,
-            exit_code=exit_code,
-            error_message=error_message,
-            stdout_size=stdout_size,
-            stderr_size=stderr_size,
-        )
+        meta = {
+            "action_name": prepared.action.name,
+            "success": success,
+            "start_time": start_time_iso,
+            "end_time": end_time_iso,
+            "duration_seconds": duration,
+            "exit_code": exit_code,
+            "stdout_size": stdout_size,
+            "stderr_size": stderr_size,
+        }
+        if error_message:
+            meta["error_message"] = error_message
+
+        # Written in the background; flushed before the run directory is used again
+        self._meta_writer.submit(prepared.action_dir / "meta.json", meta)
+
         return ActionResult(
             action_name=prepared.action.name,
             success=success,
@@ -1082,25 +1428,45 @@ class ExecutionEngine:
         Returns:
             Error message if validation fails, None if all valid
         """
+        checked: list[tuple[Any, Any, Optional[Path]]] = []
         for ret_decl in return_declarations:
             if ret_decl.return_type not in (ReturnType.FILE, ReturnType.DIRECTORY):
                 continue
 
             output_value = outputs.get(ret_decl.name)
             if output_value is None:
-                return f"Output '{ret_decl.name}' not found"
+                checked.append((ret_decl, output_value, None))
+            # os.path.isabs inspects the raw string without building a Path first
+            elif os.path.isabs(output_value):
+                checked.append((ret_decl, output_value, Path(output_value)))
+            else:
+                checked.append((ret_decl, output_value, self.project_root / output_value))
+
+        # One stat answers both whether a path exists and what it is. With many
+        # paths they are issued concurrently, since on network filesystems each
+        # stat costs a round trip
+        paths = [path for _, _, path in checked if path is not None]
+        if len(paths) > _SERIAL_STAT_LIMIT:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(_STAT_WORKERS, len(paths))
+            ) as pool:
+                modes = dict(zip(paths, pool.map(_stat_mode, paths)))
+        else:
+            modes = {path: _stat_mode(path) for path in paths}
 
-            path = Path(output_value)
-            if not path.is_absolute():
-                path = self.project_root / path
+        # Errors are reported in declaration order, however the stats completed
+        for ret_decl, output_value, path in checked:
+            if path is None:
+                return f"Output '{ret_decl.name}' not found"
 
-            if not path.exists():
+            mode = modes[path]
+            if mode is None:
                 return (
                     f"{ret_decl.return_type.value.capitalize()} "
                     f"'{ret_decl.name}' does not exist: {output_value}"
                 )
 
-            if ret_decl.return_type == ReturnType.FILE and not path.is_file():
+            if ret_decl.return_type == ReturnType.FILE and not stat.S_ISREG(mode):
                 return f"Output '{ret_decl.name}' is not a file: {output_value}"
 
         return None
@@ -1125,8 +1491,11 @@ class ExecutionEngine:
         if self.github_actions or self.verbose:
             self.output.print_command(' '.join(prepared.exec_cmd))
 
+        # The wall clock is read once; the end timestamp is derived from the
+        # monotonic duration so meta.json times always agree with it
         start_time = datetime.now()
         start_time_iso = start_time.isoformat()
+        start_ns = time.monotonic_ns()
 
         try:
             # Execute subprocess with output streaming
@@ -1135,45 +1504,45 @@ class ExecutionEngine:
             if self.github_actions:
                 self.output.print_raw("::endgroup::")
 
-            end_time = datetime.now()
-            end_time_iso = end_time.isoformat()
-            duration = (end_time - start_time).total_seconds()
+            duration = (time.monotonic_ns() - start_ns) / 1e9
+            # Fields shared by every result built below
+            common: dict[str, Any] = {
+                "start_time_iso": start_time_iso,
+                "end_time_iso": (start_time + timedelta(seconds=duration)).isoformat(),
+                "duration": duration,
+                "stdout_size": subprocess_result.stdout_size,
+                "stderr_size": subprocess_result.stderr_size,
+            }
 
             # Handle non-zero exit code
             if subprocess_result.returncode != 0:
-                if prepared.output_json_path.exists():
-                    self._add_success_to_output_json(prepared.output_json_path, success=False)
+                self._add_success_to_output_json(prepared.output_json_path, success=False)
                 return self._create_action_result(
                     prepared,
+                    **common,
                     success=False,
                     outputs={},
-                    start_time_iso=start_time_iso,
-                    end_time_iso=end_time_iso,
-                    duration=duration,
                     exit_code=subprocess_result.returncode,
-                    stdout_size=subprocess_result.stdout_size,
-                    stderr_size=subprocess_result.stderr_size,
                     error_message=f"Script exited with code {subprocess_result.returncode}",
                 )
 
-            # Handle missing output.json
-            if not prepared.output_json_path.exists():
+            # Parse outputs once and reuse the document when adding the success field;
+            # opening the file directly doubles as the existence check
+            try:
+                output_data = self._read_output_json(prepared.output_json_path)
+            except FileNotFoundError:
                 return self._create_action_result(
                     prepared,
+                    **common,
                     success=False,
                     outputs={},
-                    start_time_iso=start_time_iso,
-                    end_time_iso=end_time_iso,
-                    duration=duration,
                     exit_code=subprocess_result.returncode,
-                    stdout_size=subprocess_result.stdout_size,
-                    stderr_size=subprocess_result.stderr_size,
                     error_message="No output.json generated",
                 )
-
-            # Parse outputs
-            outputs = self._parse_outputs(prepared.output_json_path)
-            self._add_success_to_output_json(prepared.output_json_path, success=True)
+            outputs = self._extract_output_values(output_data)
+            self._add_success_to_output_json(
+                prepared.output_json_path, success=True, data=output_data
+            )
 
             # Validate file/directory outputs
             validation_error = self._validate_file_outputs(
@@ -1182,41 +1551,25 @@ class ExecutionEngine:
             if validation_error:
                 return self._create_action_result(
                     prepared,
+                    **common,
                     success=False,
                     outputs=outputs,
-                    start_time_iso=start_time_iso,
-                    end_time_iso=end_time_iso,
-                    duration=duration,
                     exit_code=0,
-                    stdout_size=subprocess_result.stdout_size,
-                    stderr_size=subprocess_result.stderr_size,
                     error_message=validation_error,
                 )
 
             # Success
             return self._create_action_result(
                 prepared,
+                **common,
                 success=True,
                 outputs=outputs,
-                start_time_iso=start_time_iso,
-                end_time_iso=end_time_iso,
-                duration=duration,
                 exit_code=0,
-                stdout_size=subprocess_result.stdout_size,
-                stderr_size=subprocess_result.stderr_size,
             )
 
         except Exception as e:
-            end_time = datetime.now()
-            end_time_iso = end_time.isoformat()
-            duration = (end_time - start_time).total_seconds()
-
-            exc_stdout_size = (
-                prepared.stdout_path.stat().st_size if prepared.stdout_path.exists() else 0
-            )
-            exc_stderr_size = (
-                prepared.stderr_path.stat().st_size if prepared.stderr_path.exists() else 0
-            )
+            duration = (time.monotonic_ns() - start_ns) / 1e9
+            end_time_iso = (start_time + timedelta(seconds=duration)).isoformat()
 
             return self._create_action_result(
                 prepared,
@@ -1226,58 +1579,32 @@ class ExecutionEngine:
                 end_time_iso=end_time_iso,
                 duration=duration,
                 exit_code=-1,
-                stdout_size=exc_stdout_size,
-                stderr_size=exc_stderr_size,
+                stdout_size=_file_size(prepared.stdout_path),
+                stderr_size=_file_size(prepared.stderr_path),
                 error_message=f"Execution error: {e}",
             )
 
-    def _write_action_meta(
-        self,
-        action_dir: Path,
-        action_name: str,
-        success: bool,
-        start_time: str,
-        end_time: str,
-        duration: float,
-        exit_code: int,
-        error_message: Optional[str] = None,
-        stdout_size: int = 0,
-        stderr_size: int = 0,
-    ) -> None:
-        """Write meta.json for an action."""
-        meta = {
-            "action_name": action_name,
-            "success": success,
-            "start_time": start_time,
-            "end_time": end_time,
-            "duration_seconds": duration,
-            "exit_code": exit_code,
-            "stdout_size": stdout_size,
-            "stderr_size": stderr_size,
-        }
-        if error_message:
-            meta["error_message"] = error_message
-
-        (action_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
-
     def _finalize_successful_execution(
         self,
         action_results: dict[ActionKey, ActionResult],
         restored_actions: list[ActionKey],
         graph_start_time: float,
     ) -> ExecutionResult:
-        graph_duration = time.time() - graph_start_time
+        graph_duration = time.monotonic() - graph_start_time
         sym = self.output.symbols
 
         if restored_actions and not self.github_actions:
             restored_list = ", ".join(self.output.escape(str(key)) for key in restored_actions)
-            self.output.print(f"\n{sym.Recycle} [dim]restored from previous run:[/dim] [bold cyan]{restored_list}[/bold cyan]")
+            source = "previous run or cache" if self._action_cache is not None else "previous run"
+            self.output.print(f"\n{sym.Recycle} [dim]restored from {source}:[/dim] [bold cyan]{restored_list}[/bold cyan]")
 
         if not self.keep_run_dir:
-            try:
-                shutil.rmtree(self.run_directory)
-            except Exception as e:
-                self.output.print(f"{sym.Warning} [bold yellow]Warning:[/bold yellow] Failed to clean up run directory: {self.output.escape(str(e))}")
+            # Removal can take a while for large runs; the results don't depend on it.
+            # Not a daemon thread, so the interpreter still waits for it before exiting.
+            self._cleanup_thread = threading.Thread(
+                target=self._remove_run_directory, name="mdl-run-cleanup"
+            )
+            self._cleanup_thread.start()
 
         if not self.github_actions:
             self.output.print(f"\n[dim]Total wall time:[/dim] [bold cyan]{graph_duration:.1f}s[/bold cyan]")
@@ -1288,6 +1615,126 @@ class ExecutionEngine:
             run_directory=self.run_directory,
         )
 
+    def _compute_nix_fingerprint(self) -> str:
+        """Hash flake.nix and flake.lock, which decide the environment actions run in."""
+        digest = hashlib.blake2b(digest_size=20)
+        for name in ("flake.nix", "flake.lock"):
+            path = self.project_root / name
+            digest.update(name.encode("utf-8"))
+            if path.is_file():
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _action_cache_key(self, prepared: PreparedAction) -> str:
+        """Compute the cache key of a prepared action from everything its result depends on.
+
+        Only declared environment variables are included, so actions must
+        declare the variables they read for the cache to stay correct.
+
+        Args:
+            prepared: Prepared action
+
+        Returns:
+            Cache key
+        """
+        context = prepared.context
+        env_names = (
+            self._passthrough_env_set
+            | set(prepared.action.required_env_vars)
+            | set(prepared.version.env_dependencies)
+        )
+        return ActionCache.compute_key({
+            "action": str(prepared.action_key),
+            "language": prepared.version.language,
+            "script": prepared.version.bash_script,
+            "project_root": str(self.project_root),
+            "nix": self._nix_fingerprint,
+            "axis": context.axis_values,
+            "args": context.args,
+            "flags": context.flags,
+            "md_env": context.md_env_vars,
+            "env": {name: self._base_env.get(name) for name in sorted(env_names)},
+            "dependencies": context.action_outputs,
+        })
+
+    def _is_cacheable(self, output_data: dict[str, Any]) -> bool:
+        """Check whether a successful result can be reused by later runs.
+
+        File and directory outputs point at filesystem state the cache does
+        not capture, and outputs naming the run directory stop being valid
+        once it is removed. Types are taken from output.json, because python
+        actions and quoted or dynamic bash ret lines declare no returns.
+
+        Args:
+            output_data: Parsed output.json of the action
+
+        Returns:
+            True if the action directory can be stored in the cache
+        """
+        for info in output_data.values():
+            if info.get("type") in (ReturnType.FILE.value, ReturnType.DIRECTORY.value):
+                return False
+        return str(self.run_directory) not in json.dumps(output_data, default=str)
+
+    def _restore_from_cache(self, cache_entry: Path, prepared: PreparedAction) -> ActionResult:
+        """Reuse a cached action directory instead of running the action.
+
+        Args:
+            cache_entry: Cached directory returned by ActionCache.lookup
+            prepared: Prepared action whose directory receives the cached files
+
+        Returns:
+            Action result rebuilt from the cached files
+        """
+        # Restore into an empty directory, like _restore_from_previous, so the
+        # entry is hard-linked as a whole instead of copied over the rendered files
+        assert self._action_cache is not None, "cache hits require an action cache"
+        shutil.rmtree(prepared.action_dir)
+        self._action_cache.restore(cache_entry, prepared.action_dir)
+        meta = json.loads((prepared.action_dir / "meta.json").read_bytes())
+        outputs = self._parse_outputs(prepared.output_json_path, skip_success=True)
+        return ActionResult(
+            action_name=prepared.action.name,
+            success=True,
+            outputs=outputs,
+            stdout_path=prepared.stdout_path,
+            stderr_path=prepared.stderr_path,
+            script_path=prepared.script_path,
+            start_time=meta.get("start_time", ""),
+            end_time=meta.get("end_time", ""),
+            duration_seconds=meta.get("duration_seconds", 0.0),
+            exit_code=meta.get("exit_code", 0),
+            restored=True,
+            stdout_size=meta.get("stdout_size", 0),
+            stderr_size=meta.get("stderr_size", 0),
+        )
+
+    def _store_cached_actions(self) -> None:
+        """Copy actions that succeeded in this run into the action cache, then prune it."""
+        if self._action_cache is None:
+            return
+        for cache_key, action_dir in self._pending_cache_stores:
+            try:
+                if self._is_cacheable(self._read_output_json(action_dir / "output.json")):
+                    self._action_cache.store(cache_key, action_dir)
+            except (OSError, ValueError) as e:
+                self.output.print_warning(f"Failed to cache {action_dir.name}: {e}")
+        self._pending_cache_stores.clear()
+        self._action_cache.prune()
+
+    def _remove_run_directory(self) -> None:
+        """Delete the run directory, warning instead of failing."""
+        sym = self.output.symbols
+        try:
+            shutil.rmtree(self.run_directory)
+        except Exception as e:
+            self.output.print(f"{sym.Warning} [bold yellow]Warning:[/bold yellow] Failed to clean up run directory: {self.output.escape(str(e))}")
+
+    def wait_cleanup(self) -> None:
+        """Block until the background removal of the run directory has finished."""
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join()
+
     def _can_restore_from_previous(self, action_name: str) -> bool:
         """Check if an action can be restored from previous run.
 
@@ -1297,58 +1744,70 @@ class ExecutionEngine:
         Returns:
             True if action was successful in previous run
         """
-        if self.previous_run_directory is None:
-            return False
+        meta = self._load_prev_meta(action_name)
+        return meta is not None and meta.get("success", False)
 
-        prev_action_dir = self.previous_run_directory / action_name
-        prev_meta_path = prev_action_dir / "meta.json"
+    def _load_prev_meta(self, action_dirname: str) -> Optional[dict[str, Any]]:
+        """Load an action's meta.json from the previous run, parsing it at most once.
+
+        Args:
+            action_dirname: Directory name for the action (may include context)
+
+        Returns:
+            Parsed metadata, or None if there is no previous run or it is unreadable
+        """
+        if self.previous_run_directory is None or action_dirname not in self._prev_action_dirnames:
+            return None
 
-        if not prev_meta_path.exists():
-            return False
+        if action_dirname in self._prev_meta_cache:
+            return self._prev_meta_cache[action_dirname]
 
+        prev_meta_path = self.previous_run_directory / action_dirname / "meta.json"
+        meta: Optional[dict[str, Any]]
         try:
-            meta = json.loads(prev_meta_path.read_text(encoding="utf-8"))
-            return meta.get("success", False)
+            meta = json.loads(prev_meta_path.read_bytes())
         except Exception:
-            return False
+            meta = None
+        self._prev_meta_cache[action_dirname] = meta
+        return meta
 
-    def _restore_from_previous(self, action_dirname: str, action_key_str: str) -> ActionResult:
+    def _restore_from_previous(self, action_dirname: str, action_key: ActionKey) -> ActionResult:
         """Restore action from previous run.
 
         Args:
             action_dirname: Directory name for the action (may include context)
-            action_key_str: Full ActionKey string for result
+            action_key: Key of the action being restored
 
         Returns:
             Action result from previous run
         """
         prev_action_dir = self.previous_run_directory / action_dirname
-        prev_meta_path = prev_action_dir / "meta.json"
         prev_output_path = prev_action_dir / "output.json"
 
-        # Load metadata
-        meta = json.loads(prev_meta_path.read_text(encoding="utf-8"))
+        # Already parsed by _can_restore_from_previous
+        meta = self._load_prev_meta(action_dirname) or {}
 
-        # Copy entire action directory to current run
+        # Bring the action directory into the current run
         current_action_dir = self.run_directory / action_dirname
-        shutil.copytree(prev_action_dir, current_action_dir)
-
-        # Parse outputs - need to find node by matching action name
-        # Search through graph nodes to find one with matching action name
-        version = None
-        for node in self.graph.nodes.values():
-            # Extract action name from key string (format: "name" or "context#name")
-            action_name = action_key_str.split("#")[-1] if "#" in action_key_str else action_key_str
-            if node.action.name == action_name or node.key.id.name == action_name:
-                version = node.selected_version
-                break
+        if self.restore_mode == "symlink":
+            # Resolved so restores from a restored run don't chain links
+            os.symlink(prev_action_dir.resolve(), current_action_dir, target_is_directory=True)
+        else:
+            copy_function = _link_or_copy if self.restore_mode == "hardlink" else shutil.copy2
+            shutil.copytree(prev_action_dir, current_action_dir, copy_function=copy_function)
+
+        version = self.graph.get_node(action_key).selected_version
 
         outputs = {}
-        if prev_output_path.exists() and version is not None:
-            outputs = self._parse_outputs(prev_output_path)
+        if version is not None:
+            try:
+                # The "success" entry was added by the engine, not returned by the action
+                outputs = self._parse_outputs(prev_output_path, skip_success=True)
+            except FileNotFoundError:
+                pass
 
         return ActionResult(
-            action_name=action_key_str,  # Use full key string for result
+            action_name=str(action_key),  # Use full key string for result
             success=True,
             outputs=outputs,
             stdout_path=current_action_dir / "stdout.log",
@@ -1363,38 +1822,85 @@ class ExecutionEngine:
             stderr_size=meta.get("stderr_size", 0),
         )
 
-    def _parse_outputs(self, output_json_path: Path) -> dict[str, Any]:
+    def _parse_outputs(self, output_json_path: Path, skip_success: bool = False) -> dict[str, Any]:
         """Parse outputs from output.json.
 
         Args:
             output_json_path: Path to output.json
+            skip_success: Whether to skip the "success" entry added by the engine
 
         Returns:
             Dictionary of outputs
         """
+        return self._extract_output_values(self._read_output_json(output_json_path), skip_success)
+
+    @staticmethod
+    def _read_output_json(output_json_path: Path) -> dict[str, Any]:
+        """Load output.json from raw bytes, skipping the separate text decode.
+
+        Args:
+            output_json_path: Path to output.json
+
+        Returns:
+            The parsed output.json document
+
+        Raises:
+            FileNotFoundError: If output.json does not exist
+            ValueError: If output.json cannot be read or parsed
+        """
         try:
-            data = json.loads(output_json_path.read_text(encoding="utf-8"))
+            data: dict[str, Any] = json.loads(output_json_path.read_bytes())
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to parse output.json: {e}")
+        return data
 
-            # Extract just the values
-            outputs = {}
-            for name, info in data.items():
-                outputs[name] = info["value"]
+    @staticmethod
+    def _extract_output_values(
+        data: dict[str, Any], skip_success: bool = False
+    ) -> dict[str, Any]:
+        """Extract just the values from a parsed output.json document.
 
-            return outputs
+        Args:
+            data: Parsed output.json mapping names to {"type", "value"} entries
+            skip_success: Whether to skip the "success" entry added by the engine
+
+        Returns:
+            Dictionary of outputs
+        """
+        try:
+            if skip_success:
+                return {
+                    name: info["value"] for name, info in data.items() if name != "success"
+                }
+            return {name: info["value"] for name, info in data.items()}
         except Exception as e:
             raise ValueError(f"Failed to parse output.json: {e}")
 
-    def _add_success_to_output_json(self, output_json_path: Path, success: bool) -> None:
+    def _add_success_to_output_json(
+        self,
+        output_json_path: Path,
+        success: bool,
+        data: Optional[dict[str, Any]] = None,
+    ) -> None:
         """Add success field to output.json.
 
         Args:
             output_json_path: Path to output.json
             success: Whether the action succeeded
+            data: Already parsed output.json contents, to avoid reading it again
         """
         try:
-            data = json.loads(output_json_path.read_text(encoding="utf-8"))
+            if data is None:
+                data = self._read_output_json(output_json_path)
             data["success"] = {"type": "bool", "value": success}
-            output_json_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            # Outputs are passed to dependents in memory, so nothing in this
+            # run waits for the file; it is written with the action's meta.json
+            self._meta_writer.submit(output_json_path, data)
+        except FileNotFoundError:
+            # The script never wrote output.json, so there is nothing to mark
+            pass
         except Exception as e:
             # Don't fail if we can't add success field
             self.output.print_warning(f"Failed to add success field to output.json: {e}")
@@ -8,7 +8,7 @@ from typing import Any
 from mudyla.ast.models import ActionVersion
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Context available to actions during execution."""
 
@@ -21,7 +21,7 @@ class ExecutionContext:
     action_outputs: dict[str, dict[str, Any]]  # Outputs from previous actions
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderedScript:
     """A script prepared for execution."""
 
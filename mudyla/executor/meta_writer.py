@@ -0,0 +1,119 @@
+"""Background writer for per-action meta.json and final output.json files.
+
+Both are only read after the action finishes (by --continue restores and
+the interactive detail views), so writing them does not need to delay
+scheduling of dependent actions.
+"""
+
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+class MetaWriter:
+    """Serializes and writes action JSON files on a single daemon thread.
+
+    Callers hand off the metadata with submit() and continue immediately.
+    flush() blocks until every submitted file is on disk; the engine calls
+    it before the run directory is read back or removed.
+    """
+
+    def __init__(
+        self,
+        on_error: Callable[[str], None],
+        indent: Optional[int] = None,
+        sync: bool = False,
+    ):
+        """Initialize the writer.
+
+        Args:
+            on_error: Called with a message when a file cannot be written
+            indent: JSON indentation, or None for compact output
+            sync: Make files durable: fsync each file before it replaces the
+                old one, and each containing directory once per flush()
+        """
+        self._on_error = on_error
+        self._indent = indent
+        # Compact output drops the spaces after separators as well
+        self._separators = None if indent is not None else (",", ":")
+        self._sync = sync
+        # Directories whose renames still need an fsync; only touched by the
+        # writer thread and by flush() once the queue is drained
+        self._dirs_to_sync: set[Path] = set()
+        self._queue: queue.Queue[tuple[Path, dict[str, Any]]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, meta_path: Path, meta: dict[str, Any]) -> None:
+        """Queue meta for writing to meta_path.
+
+        Args:
+            meta_path: Destination JSON file path
+            meta: Document to serialize; must not be mutated afterwards
+        """
+        self._ensure_started()
+        self._queue.put((meta_path, meta))
+
+    def flush(self) -> None:
+        """Block until all submitted files have been written."""
+        if self._thread is not None:
+            self._queue.join()
+        if self._dirs_to_sync:
+            self._sync_dirs()
+
+    def _sync_dirs(self) -> None:
+        # Directories can't be opened for fsync on Windows
+        if not hasattr(os, "O_DIRECTORY"):
+            self._dirs_to_sync.clear()
+            return
+        for directory in sorted(self._dirs_to_sync):
+            try:
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                self._on_error(f"Failed to sync {directory}: {e}")
+        self._dirs_to_sync.clear()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="mdl-meta-writer", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self) -> None:
+        while True:
+            meta_path, meta = self._queue.get()
+            try:
+                # Readers such as the interactive views never see a partial file
+                tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+                data = json.dumps(meta, indent=self._indent, separators=self._separators)
+                self._write_bytes(tmp_path, data.encode("utf-8"), self._sync)
+                os.replace(tmp_path, meta_path)
+                if self._sync:
+                    self._dirs_to_sync.add(meta_path.parent)
+            except Exception as e:
+                self._on_error(f"Failed to write {meta_path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _write_bytes(path: Path, data: bytes, sync: bool) -> None:
+        """Write data with raw descriptor calls, skipping the buffered file object."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,109 @@
+"""Reuse of evaluated `nix develop` environments across actions."""
+
+import subprocess
+import threading
+from pathlib import Path
+
+# Run inside the dev shell to print the environment it produced; coreutils'
+# env is always there, unlike the host interpreter's libraries
+_ENV_DUMP_COMMAND = ["env", "-0"]
+
+# Temporary directories nix creates for one shell and removes when it exits
+_SHELL_SCOPED_VARS = ("TMPDIR", "TMP", "TEMP", "TEMPDIR", "NIX_BUILD_TOP")
+
+
+class NixEnvCache:
+    """Captures the environment of each distinct `nix develop` invocation once.
+
+    `nix develop` evaluates the flake and runs its shell hook before starting
+    the command, which usually costs far more than a small action. Actions
+    that share the same `--keep` set get an identical environment, so it is
+    captured on first use and later actions run directly inside it.
+    """
+
+    def __init__(self, project_root: Path, base_env: dict[str, str]):
+        """Initialize the cache.
+
+        Args:
+            project_root: Directory nix develop is run from
+            base_env: Environment nix develop itself is started with
+        """
+        self._project_root = project_root
+        self._base_env = base_env
+        self._envs: dict[tuple[str, ...], dict[str, str]] = {}
+        # One lock per prefix, so distinct keep sets are evaluated concurrently
+        self._key_locks: dict[tuple[str, ...], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, nix_prefix: list[str]) -> dict[str, str]:
+        """Get the environment a command would see when run under nix_prefix.
+
+        Args:
+            nix_prefix: `nix develop ... --command` prefix without the command
+
+        Returns:
+            The captured environment; shared, must not be mutated
+
+        Raises:
+            ValueError: If nix develop fails or prints an unreadable environment
+        """
+        key = tuple(nix_prefix)
+        env = self._envs.get(key)
+        if env is not None:
+            return env
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Held during capture so concurrent actions never evaluate the same shell twice
+        with key_lock:
+            env = self._envs.get(key)
+            if env is None:
+                env = self._capture(nix_prefix)
+                self._envs[key] = env
+        return env
+
+    def _capture(self, nix_prefix: list[str]) -> dict[str, str]:
+        """Run the environment dump under nix_prefix.
+
+        The shell's temporary directories are gone once the capturing shell
+        exits, so they are replaced by the base environment's values, or
+        dropped if it has none.
+
+        Args:
+            nix_prefix: `nix develop ... --command` prefix without the command
+
+        Returns:
+            The environment of the dev shell
+
+        Raises:
+            ValueError: If nix develop fails or prints an unreadable environment
+        """
+        result = subprocess.run(
+            nix_prefix + _ENV_DUMP_COMMAND,
+            cwd=str(self._project_root),
+            env=self._base_env,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        if result.returncode != 0:
+            raise ValueError(
+                f"Failed to capture nix develop environment (exit code {result.returncode}): "
+                f"{result.stderr.strip()}"
+            )
+        env = {}
+        for entry in result.stdout.split("\0"):
+            if not entry:
+                continue
+            name, sep, value = entry.partition("=")
+            if not sep:
+                raise ValueError(f"Failed to parse nix develop environment entry: {entry!r}")
+            env[name] = value
+
+        for name in _SHELL_SCOPED_VARS:
+            if name in self._base_env:
+                env[name] = self._base_env[name]
+            else:
+                env.pop(name, None)
+        return env
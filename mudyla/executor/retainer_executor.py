@@ -1,5 +1,6 @@
 """Executor for retainer actions that decide soft dependency retention."""
 
+import concurrent.futures
 import os
 import subprocess
 import tempfile
@@ -9,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from ..ast.models import ParsedDocument
+from ..dag.context import ContextId
 from ..dag.graph import ActionGraph, ActionKey, Dependency
 from .runtime_registry import RuntimeRegistry
 from .runtime_bash import BashRuntime
@@ -16,6 +18,22 @@ from .runtime_python import PythonRuntime
 from .language_runtime import ExecutionContext, LanguageRuntime
 
 
+def _find_tmpfs_dir() -> str | None:
+    """Return a writable memory-backed directory for retainer scratch files, if any.
+
+    Retainer scripts are passed to their interpreter as an argument rather
+    than executed directly, so a noexec mount is fine.
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return None
+
+
+# Checked once at import; None falls back to the default temporary directory
+_TMPFS_DIR = _find_tmpfs_dir()
+
+
 @dataclass
 class RetainerExecutionResult:
     """Internal result from executing a retainer."""
@@ -83,6 +101,27 @@ class RetainerExecutor:
         self.without_nix = without_nix
         self.verbose = verbose
 
+        # Whether retainers are wrapped in nix develop does not change between
+        # them, so flake.nix is looked up once. Projects whose retainers only
+        # inspect args, flags and files can skip the dev shell entirely
+        self._use_nix = not without_nix and not document.properties.retainers_without_nix
+        self._nix_prefix: list[str] | None = None
+        if self._use_nix and (project_root / "flake.nix").exists():
+            self._nix_prefix = ["nix", "develop", str(project_root), "-c"]
+
+        # The environment does not change while retainers run, so both the
+        # process environment and the variables exposed to scripts are
+        # resolved once; they are shared and must not be mutated
+        self._base_env = dict(os.environ)
+        self._context_env_vars = dict(environment_vars)
+        for var_name in passthrough_env_vars:
+            if var_name in self._base_env:
+                self._context_env_vars[var_name] = self._base_env[var_name]
+
+        # Execution contexts depend only on the retainer's context id, which
+        # many retainers share
+        self._contexts: dict[ContextId, ExecutionContext] = {}
+
         # Register runtimes
         for runtime_cls in (BashRuntime, PythonRuntime):
             RuntimeRegistry.ensure_registered(runtime_cls)
@@ -107,15 +146,21 @@ class RetainerExecutor:
         retainers_to_run: dict[ActionKey, list[Dependency]] = {}
         for dep in pending_soft_deps:
             if dep.retainer_action:
-                if dep.retainer_action not in retainers_to_run:
-                    retainers_to_run[dep.retainer_action] = []
-                retainers_to_run[dep.retainer_action].append(dep)
-
-        # Execute each unique retainer
-        for retainer_key, soft_deps in retainers_to_run.items():
-            start_time = time.perf_counter()
-            exec_result = self._execute_retainer(retainer_key)
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
+                retainers_to_run.setdefault(dep.retainer_action, []).append(dep)
+
+        # Retainers have no dependencies and each runs in its own temporary
+        # directory, so they all run at once; results keep the grouping order
+        max_workers = max(1, min(len(retainers_to_run), os.cpu_count() or 1))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mdl-retainer"
+        ) as pool:
+            futures = [
+                pool.submit(self._execute_retainer_timed, retainer_key)
+                for retainer_key in retainers_to_run
+            ]
+
+        for (retainer_key, soft_deps), future in zip(retainers_to_run.items(), futures):
+            exec_result, elapsed_ms = future.result()
 
             # Determine which targets to actually retain
             actually_retained: list[ActionKey] = []
@@ -145,6 +190,21 @@ class RetainerExecutor:
 
         return retained_targets, retainer_results
 
+    def _execute_retainer_timed(
+        self, retainer_key: ActionKey
+    ) -> tuple[RetainerExecutionResult, float]:
+        """Execute a single retainer action and measure how long it took.
+
+        Args:
+            retainer_key: Key of the retainer action to execute
+
+        Returns:
+            Tuple of the execution result and the elapsed time in milliseconds
+        """
+        start_time = time.perf_counter()
+        exec_result = self._execute_retainer(retainer_key)
+        return exec_result, (time.perf_counter() - start_time) * 1000
+
     def _execute_retainer(self, retainer_key: ActionKey) -> RetainerExecutionResult:
         """Execute a single retainer action.
 
@@ -166,7 +226,7 @@ class RetainerExecutor:
             return RetainerExecutionResult(retained_actions=None, stdout="", stderr="")
 
         # Create temporary directory for retainer execution
-        with tempfile.TemporaryDirectory(prefix="mdl_retainer_") as temp_dir:
+        with tempfile.TemporaryDirectory(prefix="mdl_retainer_", dir=_TMPFS_DIR) as temp_dir:
             temp_path = Path(temp_dir)
             retain_signal_file = temp_path / "retain_signal"
 
@@ -195,11 +255,15 @@ class RetainerExecutor:
             env = self._build_environment(retain_signal_file)
 
             try:
+                # Output is only reported in verbose mode; otherwise it is
+                # discarded by the kernel instead of piped and buffered here
+                output_target = subprocess.PIPE if self.verbose else subprocess.DEVNULL
                 result = subprocess.run(
                     exec_cmd,
                     cwd=str(self.project_root),
                     env=env,
-                    capture_output=True,
+                    stdout=output_target,
+                    stderr=output_target,
                     text=True,
                     encoding="utf-8",
                     timeout=60,  # 1 minute timeout for retainers
@@ -238,15 +302,13 @@ class RetainerExecutor:
 
         Uses context-specific args/flags/axis_values from the retainer_key,
         falling back to global values for anything not specified in the context.
+        The result is shared by all retainers in the same context.
         """
-        # Build environment variables
-        env_vars = dict(self.environment_vars)
-        for var_name in self.passthrough_env_vars:
-            if var_name in os.environ:
-                env_vars[var_name] = os.environ[var_name]
-
         # Extract context-specific values from retainer_key.context_id
         context_id = retainer_key.context_id
+        cached = self._contexts.get(context_id)
+        if cached is not None:
+            return cached
 
         # Start with global values, then override with context-specific ones
         axis_values = dict(self.axis_values)
@@ -261,18 +323,20 @@ class RetainerExecutor:
         for name, value in context_id.flags:
             flags[name] = value
 
-        return ExecutionContext(
+        context = ExecutionContext(
             system_vars={
                 "project-root": str(self.project_root),
-                "nix": not self.without_nix,
+                "nix": self._use_nix,
             },
             axis_values=axis_values,
-            env_vars=env_vars,
+            env_vars=self._context_env_vars,
             md_env_vars=self.environment_vars,
             args=args,
             flags=flags,
             action_outputs={},  # Retainers have no dependencies
         )
+        # Concurrent retainers may build the same context twice; either copy is fine
+        return self._contexts.setdefault(context_id, context)
 
     def _build_execution_command(
         self, runtime: LanguageRuntime, script_path: Path
@@ -280,23 +344,12 @@ class RetainerExecutor:
         """Build the command to execute the retainer script."""
         base_cmd = runtime.get_execution_command(script_path)
 
-        if self.without_nix:
-            return base_cmd
-
         # Wrap with nix if available
-        flake_path = self.project_root / "flake.nix"
-        if flake_path.exists():
-            return [
-                "nix",
-                "develop",
-                str(self.project_root),
-                "-c",
-            ] + base_cmd
+        if self._nix_prefix is not None:
+            return self._nix_prefix + base_cmd
 
         return base_cmd
 
     def _build_environment(self, retain_signal_file: Path) -> dict[str, str]:
         """Build environment variables for retainer execution."""
-        env = dict(os.environ)
-        env["MDL_RETAIN_SIGNAL_FILE"] = str(retain_signal_file)
-        return env
+        return self._base_env | {"MDL_RETAIN_SIGNAL_FILE": str(retain_signal_file)}
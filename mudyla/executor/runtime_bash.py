@@ -1,8 +1,9 @@
 """Bash language runtime implementation."""
 
-import os
 import platform
+import re
 import shutil
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 
@@ -14,6 +15,19 @@ from mudyla.executor.language_runtime import (
 )
 
 
+@lru_cache(maxsize=1024)
+def _expansion_pattern(texts: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a pattern matching any of the given expansion texts.
+
+    Args:
+        texts: Distinct expansion texts, longest first so none is shadowed by a prefix
+
+    Returns:
+        Compiled alternation of the escaped texts
+    """
+    return re.compile("|".join(re.escape(text) for text in texts))
+
+
 class BashRuntime(LanguageRuntime):
     """Bash language runtime with interpolation-based value passing."""
 
@@ -45,10 +59,14 @@ class BashRuntime(LanguageRuntime):
             "actions": context.action_outputs,
         }
 
-        # Resolve all expansions by interpolation
+        # Resolve each distinct expansion once, then substitute in a single pass
+        replacements: dict[str, str] = {}
         for expansion in version.expansions:
-            resolved_value = expansion.resolve(resolution_context)
-            rendered = rendered.replace(expansion.original_text, resolved_value)
+            if expansion.original_text not in replacements:
+                replacements[expansion.original_text] = expansion.resolve(resolution_context)
+        if replacements:
+            pattern = _expansion_pattern(tuple(sorted(replacements, key=len, reverse=True)))
+            rendered = pattern.sub(lambda match: replacements[match.group(0)], rendered)
 
         # Build runtime header - source runtime.sh directly from package
         runtime_resource = resources.files("mudyla").joinpath("runtime.sh")
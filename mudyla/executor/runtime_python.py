@@ -1,7 +1,6 @@
 """Python language runtime implementation."""
 
 import json
-from importlib import resources
 from pathlib import Path
 
 from mudyla.ast.models import ActionVersion
@@ -11,6 +10,18 @@ from mudyla.executor.language_runtime import (
     RenderedScript,
 )
 
+# Preamble prepended to every python action; only the two paths vary
+_INIT_TEMPLATE = """#!/usr/bin/env python3
+
+# Initialize Mudyla runtime from package
+from mudyla import runtime as _mdl_runtime
+_mdl_runtime._initialize_runtime({context_path!r}, {output_path!r})
+
+# Import mdl context object
+from mudyla.runtime import mdl
+
+"""
+
 
 class PythonRuntime(LanguageRuntime):
     """Python language runtime with object-based value passing."""
@@ -44,20 +55,16 @@ class PythonRuntime(LanguageRuntime):
             "flags": context.flags,
             "actions": context.action_outputs,
         }
-        context_json_path.write_text(json.dumps(context_data, indent=2), encoding="utf-8")
+        # Only the runtime reads this file, so it is written without whitespace
+        context_json_path.write_text(
+            json.dumps(context_data, separators=(",", ":")), encoding="utf-8"
+        )
 
         # Build initialization code
         # Import runtime directly from mudyla package
-        init_code = f'''#!/usr/bin/env python3
-
-# Initialize Mudyla runtime from package
-from mudyla import runtime as _mdl_runtime
-_mdl_runtime._initialize_runtime({str(context_json_path)!r}, {str(output_json_path)!r})
-
-# Import mdl context object
-from mudyla.runtime import mdl
-
-'''
+        init_code = _INIT_TEMPLATE.format(
+            context_path=str(context_json_path), output_path=str(output_json_path)
+        )
 
         # Append user script
         full_script = init_code + version.bash_script
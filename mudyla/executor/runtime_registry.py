@@ -9,6 +9,8 @@ class RuntimeRegistry:
     """Registry for available language runtimes."""
 
     _registry: dict[str, type[LanguageRuntime]] = {}
+    # Runtimes hold no state, so one shared instance per language is enough
+    _instances: dict[str, LanguageRuntime] = {}
 
     @classmethod
     def register(cls, runtime_cls: type[LanguageRuntime]) -> None:
@@ -16,14 +18,19 @@ class RuntimeRegistry:
         runtime = runtime_cls()
         language_name = runtime.get_language_name()
         cls._registry[language_name] = runtime_cls
+        cls._instances[language_name] = runtime
 
     @classmethod
     def ensure_registered(cls, runtime_cls: type[LanguageRuntime]) -> None:
         """Register runtime only if not present."""
+        # Engines call this on every construction; skip instantiating known classes
+        if runtime_cls in cls._registry.values():
+            return
         runtime = runtime_cls()
         language_name = runtime.get_language_name()
         if language_name not in cls._registry:
             cls._registry[language_name] = runtime_cls
+            cls._instances[language_name] = runtime
 
     @classmethod
     def get(cls, language: str) -> LanguageRuntime:
@@ -33,10 +40,14 @@ class RuntimeRegistry:
                 f"Unsupported language: {language}. "
                 f"Supported languages: {', '.join(sorted(cls._registry.keys()))}"
             )
-        return cls._registry[language]()
+        runtime = cls._instances.get(language)
+        if runtime is None:
+            runtime = cls._registry[language]()
+            cls._instances[language] = runtime
+        return runtime
 
     @classmethod
     def all(cls) -> Iterable[LanguageRuntime]:
         """Iterate over all registered runtimes."""
-        for runtime_cls in cls._registry.values():
-            yield runtime_cls()
+        for language in list(cls._registry):
+            yield cls.get(language)
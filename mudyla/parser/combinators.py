@@ -14,8 +14,6 @@ from pyparsing import (
     restOfLine,
 )
 
-from ..ast.types import ReturnType
-
 
 class MudylaGrammar:
     """Parser combinators for Mudyla markdown definitions."""
@@ -1,7 +1,6 @@
 """Parser for expansions in bash scripts."""
 
 import re
-from typing import Optional
 
 from ..ast.expansions import (
     Expansion,
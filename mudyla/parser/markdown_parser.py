@@ -649,6 +649,7 @@ class MarkdownParser:
     ) -> DocumentProperties:
         """Parse document-level properties."""
         sequential_default = False
+        retainers_without_nix = False
 
         for offset, raw_line in enumerate(section.content.splitlines(), start=section.line_number + 1):
             stripped = raw_line.strip()
@@ -669,12 +670,17 @@ class MarkdownParser:
             normalized = property_name.lower()
             if normalized == "sequential":
                 sequential_default = True
+            elif normalized == "retainers-without-nix":
+                retainers_without_nix = True
             else:
                 raise ValueError(
                     f"{file_path}:{offset}: Unknown property '{property_name}'"
                 )
 
-        return DocumentProperties(sequential_execution_default=sequential_default)
+        return DocumentProperties(
+            sequential_execution_default=sequential_default,
+            retainers_without_nix=retainers_without_nix,
+        )
 
     def _parse_action(
         self, section: Section, action_name: str, file_path: Path
@@ -1,7 +1,6 @@
 """Parser for return declarations in bash scripts."""
 
 import re
-from typing import Optional
 
 from ..ast.models import ReturnDeclaration, SourceLocation
 from ..ast.types import ReturnType
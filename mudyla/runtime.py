@@ -212,7 +212,9 @@ class _OutputCollector:
         if self.output_path:
             output_file = Path(self.output_path)
             with output_file.open("w", encoding="utf-8") as f:
-                json.dump(self.outputs, f, indent=2)
+                # The engine rewrites this file with the success field, so it
+                # is only kept compact here
+                json.dump(self.outputs, f, separators=(",", ":"))
 
 
 # Global collector instance
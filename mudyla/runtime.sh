@@ -56,8 +56,37 @@ ret() {
 # Trap to write JSON on exit
 trap 'mudyla_write_outputs' EXIT
 
+# Store a value as a JSON string in the variable named by $1, trimming
+# surrounding whitespace. Escaping is done in bash so no process is started
+# per value.
+mudyla_json_string() {
+    local s="$2"
+    s="${s#"${s%%[![:space:]]*}"}"
+    s="${s%"${s##*[![:space:]]}"}"
+    s="${s//\\/\\\\}"
+    s="${s//\"/\\\"}"
+    s="${s//$'\n'/\\n}"
+    s="${s//$'\r'/\\r}"
+    s="${s//$'\t'/\\t}"
+    if [[ "$s" == *[[:cntrl:]]* ]]; then
+        # Remaining control characters are rare, escape them one by one
+        local out="" c hex i
+        for ((i = 0; i < ${#s}; i++)); do
+            c="${s:i:1}"
+            if [[ "$c" == [[:cntrl:]] ]]; then
+                printf -v hex '\\u%04x' "'$c"
+                out+="$hex"
+            else
+                out+="$c"
+            fi
+        done
+        s="$out"
+    fi
+    printf -v "$1" '"%s"' "$s"
+}
+
 mudyla_write_outputs() {
-    echo "{" > "$MDL_OUTPUT_JSON"
+    local json="{"$'\n'
     local first=true
     for line in "${MDL_OUTPUT_LINES[@]}"; do
         local name="${line%%:*}"
@@ -68,7 +97,7 @@ mudyla_write_outputs() {
         if [ "$first" = true ]; then
             first=false
         else
-            echo "," >> "$MDL_OUTPUT_JSON"
+            json+=","$'\n'
         fi
 
         # Format value for JSON based on type
@@ -88,13 +117,13 @@ mudyla_write_outputs() {
                 ;;
             *)
                 # String types (string, file, directory, etc.) - escape and quote
-                json_value=$(printf '%s' "$value" | python3 -c 'import sys, json; print(json.dumps(sys.stdin.read().strip()))')
+                mudyla_json_string json_value "$value"
                 ;;
         esac
-        printf '  "%s": {"type": "%s", "value": %s}' "$name" "$type" "$json_value" >> "$MDL_OUTPUT_JSON"
+        json+="  \"$name\": {\"type\": \"$type\", \"value\": $json_value}"
     done
-    echo "" >> "$MDL_OUTPUT_JSON"
-    echo "}" >> "$MDL_OUTPUT_JSON"
+    # Written with a single redirection instead of one append per line
+    printf '%s\n}\n' "$json" > "$MDL_OUTPUT_JSON"
 }
 
 # Initialize output tracking
@@ -124,6 +124,13 @@ class TestExecutionModes:
 
         mdl.assert_in_output(result, "Execution mode: parallel")
 
+    def test_max_parallel_limits_workers(self, mdl: MudylaRunner, clean_test_output):
+        """Test that --max-parallel 1 still runs a graph to completion."""
+        result = mdl.run_success(["--max-parallel", "1", ":create-directory", ":write-message"])
+
+        mdl.assert_in_output(result, "Execution mode: parallel")
+        mdl.assert_in_output(result, "Execution completed successfully")
+
     def test_continue_from_previous_run(self, mdl: MudylaRunner, clean_test_output):
         """Test continuing from a previous run."""
         from pathlib import Path
@@ -166,6 +173,27 @@ class TestExecutionModes:
         run_dirs_after = list(runs_dir.iterdir())
         assert len(run_dirs_after) >= 1, f"Expected at least 1 run dir after continue, found {len(run_dirs_after)}"
 
+    def test_continue_with_symlink_restore(self, mdl: MudylaRunner, clean_test_output):
+        """Test that --restore-mode symlink links restored actions to the previous run."""
+        from pathlib import Path
+
+        result1 = mdl.run_success(["--keep-run-dir", ":write-message"])
+        mdl.assert_in_output(result1, "Execution completed successfully")
+
+        result2 = mdl.run_success(
+            ["--keep-run-dir", "--continue", "--restore-mode", "symlink", ":write-message"]
+        )
+        mdl.assert_in_output(result2, "restored from previous run")
+
+        restored_dirs = [
+            action_dir
+            for run_dir in Path(".mdl/runs").iterdir()
+            for action_dir in run_dir.iterdir()
+            if action_dir.is_symlink()
+        ]
+        assert restored_dirs, "Expected a symlinked action directory in the continued run"
+        assert all((action_dir / "meta.json").exists() for action_dir in restored_dirs)
+
     def test_verbose_mode_shows_commands(self, mdl: MudylaRunner, clean_test_output):
         """Test that verbose mode shows actual commands being run."""
         result = mdl.run_success(["--verbose", "--force-nix", ":create-directory"])
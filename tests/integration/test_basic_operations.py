@@ -196,3 +196,35 @@ class TestBasicOperations:
         mdl.assert_not_in_output(result, "Intentionally failing action stdout")
         mdl.assert_not_in_output(result, "Intentionally failing action stderr")
         mdl.assert_in_output(result, "Output suppressed")
+
+    def test_failure_output_visible_with_merged_stderr(self, mdl: MudylaRunner, clean_test_output):
+        """Ensure --merge-stderr keeps stderr visible through stdout.log."""
+        result = mdl.run_failure(["--merge-stderr", ":failing-action"])
+
+        mdl.assert_in_output(result, "Intentionally failing action stdout")
+        mdl.assert_in_output(result, "Intentionally failing action stderr")
+
+    def test_missing_file_output_fails(self, mdl: MudylaRunner, clean_test_output):
+        """Ensure a declared file output that was never created fails the action."""
+        result = mdl.run_failure([":missing-file-output"])
+
+        mdl.assert_in_output(result, "File 'file-four' does not exist: test-output/files/four.txt")
+
+    def test_reuse_nix_env(self, mdl: MudylaRunner, clean_test_output):
+        """Test executing a dependency chain in a reused Nix environment."""
+        result = mdl.run_success(["--reuse-nix-env", ":write-message"])
+
+        mdl.assert_in_output(result, "Execution completed successfully")
+        mdl.assert_file_contains("test-output/message.txt", "Hello, Mudyla!")
+        mdl.assert_in_output(result, "message-length")
+
+    def test_action_cache_reuses_unchanged_actions(self, mdl: MudylaRunner, clean_test_output):
+        """Test that --cache-dir restores an unchanged action on the second run."""
+        cache_args = ["--cache-dir", "test-output/cache"]
+
+        result1 = mdl.run_success(cache_args + [":python-hello"])
+        mdl.assert_not_in_output(result1, "restored")
+
+        result2 = mdl.run_success(cache_args + [":python-hello"])
+        mdl.assert_in_output(result2, "restored from previous run or cache")
+        mdl.assert_in_output(result2, "Hello from Python!")
@@ -0,0 +1,89 @@
+"""Tests for the content-addressed action cache."""
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+from mudyla.executor.action_cache import ActionCache
+
+
+def _make_action_dir(path: Path) -> Path:
+    path.mkdir()
+    (path / "stdout.log").write_text("hello\n", encoding="utf-8")
+    (path / "output.json").write_text('{"val": {"type": "string", "value": "ok"}}', encoding="utf-8")
+    (path / "meta.json").write_text('{"success": true}', encoding="utf-8")
+    return path
+
+
+class TestActionCache:
+    """Tests for ActionCache."""
+
+    def test_key_is_stable_and_input_sensitive(self) -> None:
+        """Equal inputs should hash equally regardless of key order."""
+        key = ActionCache.compute_key({"script": "echo hi", "args": {"a": "1", "b": "2"}})
+
+        assert key == ActionCache.compute_key({"args": {"b": "2", "a": "1"}, "script": "echo hi"})
+        assert key != ActionCache.compute_key({"script": "echo hi", "args": {"a": "1", "b": "3"}})
+
+    def test_store_then_restore(self, tmp_path: Path) -> None:
+        """A stored action directory should be found and copied into a new one."""
+        cache = ActionCache(tmp_path / "cache", shutil.copy2)
+        cache.store("abc", _make_action_dir(tmp_path / "run1"))
+
+        entry = cache.lookup("abc")
+        assert entry is not None
+
+        target = tmp_path / "run2"
+        cache.restore(entry, target)
+
+        assert (target / "stdout.log").read_text(encoding="utf-8") == "hello\n"
+        assert (target / "meta.json").exists()
+
+    def test_miss_and_incomplete_entries(self, tmp_path: Path) -> None:
+        """Unknown keys and entries without meta.json should be misses."""
+        cache = ActionCache(tmp_path / "cache", shutil.copy2)
+        (tmp_path / "cache" / "partial").mkdir(parents=True)
+
+        assert cache.lookup("missing") is None
+        assert cache.lookup("partial") is None
+
+    def test_store_keeps_existing_entry(self, tmp_path: Path) -> None:
+        """Storing an existing key should leave the first entry and no temporary files."""
+        cache = ActionCache(tmp_path / "cache", shutil.copy2)
+        cache.store("abc", _make_action_dir(tmp_path / "run1"))
+        second = _make_action_dir(tmp_path / "run2")
+        (second / "stdout.log").write_text("changed\n", encoding="utf-8")
+        cache.store("abc", second)
+
+        assert (tmp_path / "cache" / "abc" / "stdout.log").read_text(encoding="utf-8") == "hello\n"
+        assert [p.name for p in (tmp_path / "cache").iterdir()] == ["abc"]
+
+    def test_prune_removes_unused_entries_and_stale_temporaries(self, tmp_path: Path) -> None:
+        """Old entries and leftover temporaries should go, recently used entries should stay."""
+        cache = ActionCache(tmp_path / "cache", shutil.copy2, max_age_seconds=86400)
+        for key in ("old", "used", "fresh"):
+            cache.store(key, _make_action_dir(tmp_path / key))
+        (tmp_path / "cache" / ".dead.1.2.tmp").mkdir()
+        (tmp_path / "cache" / ".live.1.2.tmp").mkdir()
+        week_ago = time.time() - 7 * 86400
+        for name in ("old", "used", ".dead.1.2.tmp"):
+            os.utime(tmp_path / "cache" / name, (week_ago, week_ago))
+
+        assert cache.lookup("used") is not None
+        assert cache.prune() == 2
+        assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == [
+            ".live.1.2.tmp",
+            "fresh",
+            "used",
+        ]
+
+    def test_prune_without_max_age_keeps_entries(self, tmp_path: Path) -> None:
+        """Without a maximum age, only leftover temporaries should be removed."""
+        cache = ActionCache(tmp_path / "cache", shutil.copy2)
+        cache.store("old", _make_action_dir(tmp_path / "run1"))
+        long_ago = time.time() - 365 * 86400
+        os.utime(tmp_path / "cache" / "old", (long_ago, long_ago))
+
+        assert cache.prune() == 0
+        assert cache.lookup("old") is not None
@@ -0,0 +1,61 @@
+"""Tests for the worker limit of parallel execution."""
+
+import concurrent.futures
+from pathlib import Path
+
+import pytest
+
+from mudyla.cli_args import parse_custom_inputs
+from mudyla.cli_builder import build_arg_parser
+from mudyla.dag.compiler import DAGCompiler
+from mudyla.executor.engine import ExecutionEngine
+from mudyla.parser.markdown_parser import MarkdownParser
+
+DEFINITIONS = """# action: hello
+
+```bash
+ret "message:string=hello"
+```
+"""
+
+
+@pytest.mark.parametrize("flag_value", ["1", "3"])
+def test_max_workers_follows_max_parallel(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, flag_value: str
+) -> None:
+    """The parallel executor should get exactly the --max-parallel worker count."""
+    args = build_arg_parser().parse_args(["--max-parallel", flag_value])
+    defs = tmp_path / "defs.md"
+    defs.write_text(DEFINITIONS)
+    document = MarkdownParser().parse_files([defs])
+    graph = DAGCompiler(document, parse_custom_inputs([], [":hello"])).compile()
+
+    pool_sizes: list[int] = []
+    real_executor = concurrent.futures.ThreadPoolExecutor
+
+    def recording_executor(*pool_args, **pool_kwargs):
+        pool_sizes.append(pool_kwargs["max_workers"])
+        return real_executor(*pool_args, **pool_kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", recording_executor)
+    engine = ExecutionEngine(
+        graph=graph,
+        project_root=tmp_path,
+        args={},
+        flags={},
+        environment_vars={},
+        passthrough_env_vars=[],
+        without_nix=True,
+        parallel_execution=True,
+        max_parallel=args.max_parallel,
+    )
+
+    assert engine.execute_all().success
+    assert pool_sizes == [int(flag_value)]
+
+
+@pytest.mark.parametrize("flag_value", ["0", "-2", "many"])
+def test_max_parallel_rejects_values_below_one(flag_value: str) -> None:
+    """Zero, negative and non-numeric worker counts should be parse errors."""
+    with pytest.raises(SystemExit):
+        build_arg_parser().parse_args(["--max-parallel", flag_value])
@@ -0,0 +1,120 @@
+"""Tests for restoring action outputs from a previous run or the action cache."""
+
+import json
+from pathlib import Path
+
+from mudyla.cli_args import parse_custom_inputs
+from mudyla.dag.compiler import DAGCompiler
+from mudyla.executor.engine import ExecutionEngine
+from mudyla.parser.markdown_parser import MarkdownParser
+
+DEFINITIONS = """# action: py-out
+
+```python
+mdl.ret("greeting", "hi", "string")
+```
+
+# action: sh-out
+
+```bash
+ret "message:string=hello"
+```
+"""
+
+
+CACHE_DEFINITIONS = """# action: py-file
+
+```python
+mdl.ret("report", "report.txt", "file")
+```
+
+# action: sh-string
+
+```bash
+name=message
+ret "$name:string=hello"
+```
+"""
+
+
+def _compile(tmp_path: Path, definitions: str, goals: list[str]):
+    defs = tmp_path / "defs.md"
+    defs.write_text(definitions)
+    document = MarkdownParser().parse_files([defs])
+    return DAGCompiler(document, parse_custom_inputs([], goals)).compile()
+
+
+def _make_engine(tmp_path: Path, graph, **kwargs) -> ExecutionEngine:
+    return ExecutionEngine(
+        graph=graph,
+        project_root=tmp_path,
+        args={},
+        flags={},
+        environment_vars={},
+        passthrough_env_vars=[],
+        without_nix=True,
+        parallel_execution=False,
+        **kwargs,
+    )
+
+
+def _write_previous_action(run_dir: Path, dirname: str, outputs: dict) -> None:
+    action_dir = run_dir / dirname
+    action_dir.mkdir(parents=True)
+    (action_dir / "meta.json").write_text(json.dumps({"success": True}))
+    output = {name: {"type": "string", "value": value} for name, value in outputs.items()}
+    output["success"] = {"type": "bool", "value": True}
+    (action_dir / "output.json").write_text(json.dumps(output))
+
+
+def test_restores_outputs_without_declared_returns(tmp_path: Path) -> None:
+    """Python and quoted-ret bash outputs should come back, without the added success entry."""
+    graph = _compile(tmp_path, DEFINITIONS, [":py-out", ":sh-out"])
+
+    previous = tmp_path / "previous"
+    _write_previous_action(previous, "py-out", {"greeting": "hi"})
+    _write_previous_action(previous, "sh-out", {"message": "hello"})
+
+    engine = _make_engine(
+        tmp_path, graph, run_directory=tmp_path / "current", previous_run_directory=previous
+    )
+    result = engine.execute_all()
+
+    outputs = {key.id.name: action.outputs for key, action in result.action_results.items()}
+    assert result.success
+    assert outputs == {"py-out": {"greeting": "hi"}, "sh-out": {"message": "hello"}}
+
+
+def test_file_outputs_without_declarations_are_not_cached(tmp_path: Path) -> None:
+    """Cacheability should follow the output types, not the declared returns."""
+    graph = _compile(tmp_path, CACHE_DEFINITIONS, [":py-file", ":sh-string"])
+    cache_dir = tmp_path / "cache"
+    (tmp_path / "report.txt").write_text("report\n")
+
+    result = _make_engine(tmp_path, graph, cache_dir=cache_dir).execute_all()
+
+    assert result.success
+    cached = [json.loads((entry / "output.json").read_text()) for entry in cache_dir.iterdir()]
+    assert [entry["message"]["value"] for entry in cached] == ["hello"]
+
+
+def test_cache_hit_links_the_whole_entry(tmp_path: Path) -> None:
+    """A cache hit should replace the prepared directory with links to the entry."""
+    graph = _compile(tmp_path, CACHE_DEFINITIONS, [":py-file", ":sh-string"])
+    (tmp_path / "report.txt").write_text("report\n")
+    cache_dir = tmp_path / "cache"
+    for run in ("first", "second"):
+        result = _make_engine(
+            tmp_path, graph, cache_dir=cache_dir, run_directory=tmp_path / run, keep_run_dir=True
+        ).execute_all()
+        assert result.success
+
+    (entry,) = cache_dir.iterdir()
+    restored = tmp_path / "second" / "sh-string"
+    assert {key.id.name: r.restored for key, r in result.action_results.items()} == {
+        "py-file": False,
+        "sh-string": True,
+    }
+    assert sorted(p.name for p in restored.iterdir()) == sorted(p.name for p in entry.iterdir())
+    for path in entry.iterdir():
+        assert (restored / path.name).stat().st_ino == path.stat().st_ino
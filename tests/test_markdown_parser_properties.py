@@ -56,3 +56,17 @@ echo ok
     document = MarkdownParser().parse_files([file2, file1])
 
     assert document.properties.sequential_execution_default is True
+
+
+def test_retainers_without_nix_property(tmp_path: Path):
+    content = """\
+# properties
+- `retainers-without-nix`
+"""
+    file_path = tmp_path / "defs.md"
+    file_path.write_text(content)
+
+    document = MarkdownParser().parse_files([file_path])
+
+    assert document.properties.retainers_without_nix is True
+    assert document.properties.sequential_execution_default is False
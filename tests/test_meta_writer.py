@@ -0,0 +1,79 @@
+"""Tests for the background meta.json writer."""
+
+import json
+from pathlib import Path
+
+from mudyla.executor.meta_writer import MetaWriter
+
+
+class TestMetaWriter:
+    """Tests for MetaWriter."""
+
+    def test_flush_waits_for_submitted_files(self, tmp_path: Path) -> None:
+        """All submitted files should be on disk once flush returns."""
+        writer = MetaWriter(on_error=lambda message: None)
+        paths = [tmp_path / f"meta-{i}.json" for i in range(20)]
+        for i, path in enumerate(paths):
+            writer.submit(path, {"action_name": f"action-{i}", "success": True})
+
+        writer.flush()
+
+        for i, path in enumerate(paths):
+            assert json.loads(path.read_text(encoding="utf-8"))["action_name"] == f"action-{i}"
+
+    def test_flush_without_submissions_returns(self) -> None:
+        """Flushing an idle writer should not block."""
+        MetaWriter(on_error=lambda message: None).flush()
+
+    def test_write_errors_are_reported(self, tmp_path: Path) -> None:
+        """Failed writes should be reported instead of killing the writer."""
+        errors: list[str] = []
+        writer = MetaWriter(on_error=errors.append)
+
+        writer.submit(tmp_path / "missing" / "meta.json", {"success": True})
+        writer.submit(tmp_path / "meta.json", {"success": True})
+        writer.flush()
+
+        assert len(errors) == 1
+        assert "missing" in errors[0]
+        assert (tmp_path / "meta.json").exists()
+
+    def test_compact_by_default(self, tmp_path: Path) -> None:
+        """Without an indent, meta.json should be written on a single line."""
+        writer = MetaWriter(on_error=lambda message: None)
+        compact_path = tmp_path / "compact.json"
+        writer.submit(compact_path, {"action_name": "build", "success": True})
+        writer.flush()
+
+        indented = MetaWriter(on_error=lambda message: None, indent=2)
+        indented_path = tmp_path / "indented.json"
+        indented.submit(indented_path, {"action_name": "build", "success": True})
+        indented.flush()
+
+        assert "\n" not in compact_path.read_text(encoding="utf-8")
+        assert json.loads(indented_path.read_text(encoding="utf-8")) == json.loads(
+            compact_path.read_text(encoding="utf-8")
+        )
+        assert "\n" in indented_path.read_text(encoding="utf-8")
+
+    def test_replaces_existing_file_atomically(self, tmp_path: Path) -> None:
+        """Rewriting a file should replace it without leaving a temporary file."""
+        path = tmp_path / "output.json"
+        path.write_text('{"old": true}', encoding="utf-8")
+
+        writer = MetaWriter(on_error=lambda message: None)
+        writer.submit(path, {"new": True})
+        writer.flush()
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"new": True}
+        assert [p.name for p in tmp_path.iterdir()] == ["output.json"]
+
+    def test_sync_writes_files(self, tmp_path: Path) -> None:
+        """Syncing should not change what ends up on disk."""
+        errors: list[str] = []
+        writer = MetaWriter(on_error=errors.append, sync=True)
+        writer.submit(tmp_path / "meta.json", {"success": True})
+        writer.flush()
+
+        assert errors == []
+        assert json.loads((tmp_path / "meta.json").read_text(encoding="utf-8")) == {"success": True}
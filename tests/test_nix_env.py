@@ -0,0 +1,70 @@
+"""Tests for the captured nix develop environment cache."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from mudyla.executor.nix_env import NixEnvCache
+
+
+class TestNixEnvCache:
+    """Tests for NixEnvCache."""
+
+    def test_captures_environment_through_prefix(self, tmp_path: Path) -> None:
+        """The environment seen by a command run under the prefix should be returned."""
+        cache = NixEnvCache(tmp_path, {"PATH": "/usr/bin:/bin", "MDL_MARKER": "yes"})
+
+        env = cache.get(["env"])
+
+        assert env["MDL_MARKER"] == "yes"
+
+    def test_shell_temp_dirs_are_not_passed_on(self, tmp_path: Path) -> None:
+        """The capturing shell's temp dirs should be replaced by the base ones or dropped."""
+        fake_shell = tmp_path / "fake-shell"
+        fake_shell.write_text(
+            '#!/bin/sh\nexec env TMPDIR=/tmp/nix-shell.1 NIX_BUILD_TOP=/tmp/nix-shell.1 "$@"\n'
+        )
+        fake_shell.chmod(0o755)
+        cache = NixEnvCache(tmp_path, {"PATH": "/usr/bin:/bin", "TMP": "/var/tmp"})
+
+        env = cache.get([str(fake_shell)])
+
+        assert "TMPDIR" not in env
+        assert "NIX_BUILD_TOP" not in env
+        assert env["TMP"] == "/var/tmp"
+
+    def test_each_prefix_is_captured_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Concurrent lookups of one prefix should share a single capture."""
+        captured: list[tuple[str, ...]] = []
+
+        def fake_capture(self: NixEnvCache, nix_prefix: list[str]) -> dict[str, str]:
+            captured.append(tuple(nix_prefix))
+            return {"PREFIX": " ".join(nix_prefix)}
+
+        monkeypatch.setattr(NixEnvCache, "_capture", fake_capture)
+        cache = NixEnvCache(tmp_path, {})
+
+        threads = [
+            threading.Thread(target=cache.get, args=(["nix", "develop", "--command"],))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache.get(["nix", "develop", "--keep", "HOME", "--command"])
+
+        assert sorted(captured) == [
+            ("nix", "develop", "--command"),
+            ("nix", "develop", "--keep", "HOME", "--command"),
+        ]
+
+    def test_failed_capture_raises(self, tmp_path: Path) -> None:
+        """A failing prefix command should surface as a ValueError."""
+        cache = NixEnvCache(tmp_path, {"PATH": "/usr/bin:/bin"})
+
+        with pytest.raises(ValueError, match="Failed to capture"):
+            cache.get(["false"])
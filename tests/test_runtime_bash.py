@@ -0,0 +1,55 @@
+"""Tests for bash script rendering."""
+
+from pathlib import Path
+
+from mudyla.ast.expansions import ArgsExpansion, FlagsExpansion
+from mudyla.ast.models import ActionVersion, SourceLocation
+from mudyla.executor.language_runtime import ExecutionContext
+from mudyla.executor.runtime_bash import BashRuntime
+
+
+def _make_version(script: str, expansions: list) -> ActionVersion:
+    return ActionVersion(
+        bash_script=script,
+        expansions=expansions,
+        return_declarations=[],
+        dependency_declarations=[],
+        env_dependencies=[],
+        args_dependencies=[],
+        conditions=[],
+        location=SourceLocation(file_path="test.md", line_number=1, section_name="test"),
+    )
+
+
+def _make_context(args: dict, flags: dict) -> ExecutionContext:
+    return ExecutionContext(
+        system_vars={},
+        axis_values={},
+        env_vars={},
+        md_env_vars={},
+        args=args,
+        flags=flags,
+        action_outputs={},
+    )
+
+
+def test_prepare_script_substitutes_every_occurrence(tmp_path: Path) -> None:
+    """Repeated and prefix-sharing expansions should all be substituted."""
+    script = 'echo "${args.name}" "${args.name-suffix}" "${args.name}" "${flags.fast}"\n'
+    version = _make_version(
+        script,
+        [
+            ArgsExpansion("${args.name}", "name"),
+            ArgsExpansion("${args.name-suffix}", "name-suffix"),
+            ArgsExpansion("${args.name}", "name"),
+            FlagsExpansion("${flags.fast}", "fast"),
+        ],
+    )
+    context = _make_context({"name": "${args.name-suffix}", "name-suffix": "b"}, {"fast": True})
+
+    rendered = BashRuntime().prepare_script(
+        version, context, tmp_path / "output.json", tmp_path
+    )
+
+    # Substituted values are not rescanned for further expansions
+    assert rendered.content.endswith('echo "${args.name-suffix}" "b" "${args.name-suffix}" "1"\n')
@@ -16,3 +16,19 @@ def test_runtime_registry_registers_and_returns_default_languages():
     languages = {runtime.get_language_name() for runtime in RuntimeRegistry.all()}
     assert "bash" in languages
     assert "python" in languages
+
+
+def test_ensure_registered_skips_known_runtime_classes(monkeypatch):
+    RuntimeRegistry.ensure_registered(BashRuntime)
+
+    def fail_init(self):
+        raise AssertionError("registered runtime should not be instantiated")
+
+    monkeypatch.setattr(BashRuntime, "__init__", fail_init)
+    RuntimeRegistry.ensure_registered(BashRuntime)
+
+
+def test_runtime_registry_reuses_runtime_instances():
+    RuntimeRegistry.register(BashRuntime)
+
+    assert RuntimeRegistry.get("bash") is RuntimeRegistry.get("bash")
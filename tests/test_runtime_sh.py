@@ -0,0 +1,45 @@
+"""Tests for the bash runtime sourced by generated scripts."""
+
+import json
+import shutil
+import subprocess
+from importlib import resources
+from pathlib import Path
+
+import pytest
+
+RUNTIME_PATH = str(resources.files("mudyla").joinpath("runtime.sh"))
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not available")
+class TestBashRuntimeOutputs:
+    """Tests for output.json written by the ret pseudo-command."""
+
+    def _run(self, tmp_path: Path, body: str) -> dict:
+        output_json = tmp_path / "output.json"
+        script = f'export MDL_OUTPUT_JSON="{output_json}"\nsource "{RUNTIME_PATH}"\n{body}\n'
+        subprocess.run(["bash", "-c", script], check=True)
+        return json.loads(output_json.read_text(encoding="utf-8"))
+
+    def test_string_values_are_escaped(self, tmp_path: Path) -> None:
+        """Quotes, backslashes and control characters should survive the round trip."""
+        outputs = self._run(
+            tmp_path,
+            "ret \"quoted:string=  say \\\"hi\\\" \\\\ there  \"\n"
+            "ret \"lines:string=one\"$'\\n'\"two\"$'\\t'\"three\"$'\\x01'\n"
+            "ret \"path:file=caf\u00e9.txt\"",
+        )
+
+        assert outputs["quoted"] == {"type": "string", "value": 'say "hi" \\ there'}
+        assert outputs["lines"]["value"] == "one\ntwo\tthree\x01"
+        assert outputs["path"] == {"type": "file", "value": "caf\u00e9.txt"}
+
+    def test_typed_and_empty_outputs(self, tmp_path: Path) -> None:
+        """Numbers and booleans are written unquoted, and no ret yields an empty object."""
+        outputs = self._run(tmp_path, 'ret "count:int=3"\nret "ok:bool=true"')
+
+        assert outputs == {
+            "count": {"type": "int", "value": 3},
+            "ok": {"type": "bool", "value": True},
+        }
+        assert self._run(tmp_path, ":") == {}